@@ -0,0 +1,74 @@
+# coding: utf-8
+"""
+Microbenchmark of the attribute access done by easy fields for every cell.
+
+    python -m benchmarks.accessors
+"""
+import os
+import timeit
+from types import SimpleNamespace
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'test_project.settings')
+django.setup()
+
+import easy  # noqa
+from easy import helper  # noqa
+
+NUMBER = 200000
+
+
+def legacy_call_or_get(obj, attr, default=None):
+    # call_or_get before the accessors were compiled, kept here as the reference
+    ret = helper.Nothing()
+
+    if callable(attr):
+        ret = attr(obj)
+
+    if isinstance(ret, helper.Nothing):
+        value = obj
+        for i in attr.split('.'):
+            value = getattr(value, i, helper.Nothing())
+        if callable(value):
+            ret = value()
+        else:
+            ret = value
+
+    if (not ret or isinstance(ret, helper.Nothing)) and default is not None:
+        ret = default
+
+    return ret
+
+
+def main():
+    obj = SimpleNamespace(poll=SimpleNamespace(owner=SimpleNamespace(name='Ezequiel')))
+    cases = (
+        ('poll.owner.name', 'present'),
+        ('poll.owner.missing', 'missing'),
+    )
+
+    print('%-20s %-8s %12s %12s %12s %12s %8s' % (
+        'path', 'case', 'legacy ns', 'helper ns', 'compiled ns', 'field ns', 'speedup'
+    ))
+    for path, case in cases:
+        field = easy.SimpleAdminField(path, default='-')
+        accessor = helper.compile_accessor(path, '-')
+
+        legacy = timeit.timeit(lambda: legacy_call_or_get(obj, path, '-'), number=NUMBER)
+        call_or_get = timeit.timeit(lambda: helper.call_or_get(obj, path, '-'), number=NUMBER)
+        compiled = timeit.timeit(lambda: accessor(obj), number=NUMBER)
+        cell = timeit.timeit(lambda: field(obj), number=NUMBER)
+
+        print('%-20s %-8s %12.1f %12.1f %12.1f %12.1f %7.2fx' % (
+            path, case,
+            legacy / NUMBER * 1e9,
+            call_or_get / NUMBER * 1e9,
+            compiled / NUMBER * 1e9,
+            cell / NUMBER * 1e9,
+            legacy / compiled,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# coding: utf-8
+"""
+Benchmark of a sync and an async easy view, served by test_project.asgi.application, on a test database.
+
+    python -m benchmarks.asgi_views
+"""
+import asyncio
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'test_project.settings')
+django.setup()
+
+from django.conf import settings  # noqa
+from django.db import connection  # noqa
+from django.test import Client  # noqa
+from django.test.utils import setup_test_environment  # noqa
+
+NUMBER = 500
+CONCURRENCY = 50
+
+
+def make_scope(path, cookie):
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': b'',
+        'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'cookie', cookie.encode())],
+        'client': ('127.0.0.1', 0),
+        'server': ('testserver', 80),
+    }
+
+
+async def request(application, scope):
+    sent = []
+    received = []
+    done = asyncio.Event()
+
+    async def receive():
+        if received:
+            # the client disconnects once the response is sent
+            await done.wait()
+            return {'type': 'http.disconnect'}
+        received.append(True)
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+        if message['type'] == 'http.response.body' and not message.get('more_body'):
+            done.set()
+
+    await application(scope, receive, send)
+    assert sent[0]['status'] == 200, sent[0]
+
+
+async def run(application, scope, concurrency):
+    start = time.perf_counter()
+    for _ in range(NUMBER // concurrency):
+        await asyncio.gather(*(request(application, scope) for _ in range(concurrency)))
+    return (time.perf_counter() - start) / NUMBER * 1000
+
+
+def main():
+    from django.contrib.auth.models import User
+    from test_project.asgi import application
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+    client = Client()
+    client.force_login(User.objects.create(username='admin', is_staff=True, is_superuser=True))
+    cookie = '%s=%s' % (settings.SESSION_COOKIE_NAME, client.cookies[settings.SESSION_COOKIE_NAME].value)
+
+    cases = (
+        ('sync', '/admin/test_app/poll/easy/test/'),
+        ('async', '/admin/test_app/poll/easy/ping/'),
+    )
+
+    print('%-8s %-36s %14s %14s' % ('view', 'path', 'serial ms', 'concurrent ms'))
+    for name, path in cases:
+        scope = make_scope(path, cookie)
+        asyncio.run(run(application, scope, 1))  # warm up
+        serial = asyncio.run(run(application, scope, 1))
+        concurrent = asyncio.run(run(application, scope, CONCURRENCY))
+        print('%-8s %-36s %14.3f %14.3f' % (name, path, serial, concurrent))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+# coding: utf-8
+"""
+Benchmark suite of easy, on a test database of test_project seeded with model_bakery:
+
+* the render time of a cell, and its queries, for every field class and decorator of easy;
+* the latency and the queries of the changelists of QuestionAdmin, PollAdmin and TagAdmin, by number of rows.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json
+
+With a baseline, every result is compared to it, and the exit status is 1 if one is slower by more than
+the threshold, or runs more queries.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from itertools import cycle
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'test_project.settings')
+django.setup()
+
+from django.conf import settings  # noqa
+from django.contrib.auth.models import User  # noqa
+from django.contrib.contenttypes.models import ContentType  # noqa
+from django.core.cache import cache  # noqa
+from django.db import connection, reset_queries  # noqa
+from django.test import Client  # noqa
+from django.test.utils import CaptureQueriesContext, setup_test_environment  # noqa
+from model_bakery import baker  # noqa
+
+import easy  # noqa
+from test_app.models import Choice, Poll, Question, Tag  # noqa
+
+ROWS = (100, 1000, 10000)
+OBJECTS = 100
+
+
+def fields():
+    # (name, model, field), a field of every class of easy.admin.field
+    return (
+        ('SimpleAdminField', Question, easy.SimpleAdminField('poll.name')),
+        ('SimpleAdminField cache', Question, easy.SimpleAdminField('poll.name', cache=True)),
+        ('BooleanAdminField', Question, easy.BooleanAdminField(lambda obj: obj.pk % 2, 'Odd')),
+        ('ForeignKeyAdminField', Question, easy.ForeignKeyAdminField('poll')),
+        ('RawIdAdminField', Question, easy.RawIdAdminField('poll')),
+        ('GenericForeignKeyAdminField', Tag, easy.GenericForeignKeyAdminField('generic', cache_content_type=True)),
+        ('LinkChangeListAdminField', Poll, easy.LinkChangeListAdminField(
+            'test_app', 'question', 'question_set.count', {'poll': 'id'})),
+        ('ExternalLinkAdminField', Question, easy.ExternalLinkAdminField(
+            'poll', 'Open', 'admin:test_app_poll_change', 'pk', 'Poll')),
+        ('TemplateAdminField', Question, easy.TemplateAdminField('test.html', {'a': '1'})),
+        ('ImageAdminField', Question, easy.ImageAdminField('image', {'title': 'question_text'})),
+        ('FilterAdminField', Question, easy.FilterAdminField('question_text', 'upper')),
+        ('CacheAdminField', Question, easy.CacheAdminField('question_text', 'upper')),
+        ('FormatAdminField', Question, easy.FormatAdminField('{o.question_text} | {o.pub_date:%Y-%m-%d}', 'Text')),
+    )
+
+
+def decorators():
+    # (name, method), a method of every decorator of easy.admin.decorators, on questions
+    def method():
+        def question_text(admin, obj):
+            return obj.question_text
+        return question_text
+
+    return (
+        ('none', method()),
+        ('smart', easy.smart(short_description='Text', allow_tags=True)(method())),
+        ('short', easy.short(desc='Text', tags=True)(method())),
+        ('action', easy.action('Text')(method())),
+        ('utils', easy.utils('html.escape')(method())),
+        ('filter', easy.filter('upper')(method())),
+        ('with_tags', easy.with_tags()(method())),
+        ('cache', easy.cache(60)(method())),
+    )
+
+
+def seed(rows):
+    """
+    Seeds polls, questions, choices and tags up to `rows` of each.
+    """
+    missing = rows - Poll.objects.count()
+    if missing <= 0:
+        return
+
+    polls = baker.make(Poll, _quantity=missing, _bulk_create=True)
+    questions = baker.make(Question, poll=cycle(polls), _quantity=missing, _bulk_create=True)
+    baker.make(Choice, question=cycle(questions), _quantity=missing, _bulk_create=True)
+    baker.make(Tag, content_type=ContentType.objects.get_for_model(Poll),
+               object_id=cycle(poll.pk for poll in polls), _quantity=missing, _bulk_create=True)
+
+
+def objects(model):
+    queryset = model.objects.order_by('pk')
+    if model is Question:
+        queryset = queryset.select_related('poll')
+    elif model is Poll:
+        queryset = queryset.prefetch_related('question_set')
+    else:
+        queryset = queryset.prefetch_related('generic')
+    return list(queryset[:OBJECTS])
+
+
+def measure_cells(render, objs, number, repeat):
+    """
+    Returns:
+        dict: The best render time of a cell of `repeat` rounds, in microseconds, and the queries by cell.
+    """
+    for obj in objs:
+        render(obj)
+
+    with CaptureQueriesContext(connection) as queries:
+        for obj in objs:
+            render(obj)
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            for obj in objs:
+                render(obj)
+        times.append(time.perf_counter() - start)
+
+    return {
+        'us': round(min(times) / (number * len(objs)) * 1e6, 3),
+        'queries': round(len(queries) / len(objs), 3),
+    }
+
+
+def measure_changelist(client, url, repeat):
+    """
+    Returns:
+        dict: The median latency of the changelist, in milliseconds, and its queries.
+    """
+    client.get(url)
+
+    # request_started resets the queries log, start the capture from an empty one
+    reset_queries()
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200, response.status_code
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.get(url)
+        times.append(time.perf_counter() - start)
+
+    return {'ms': round(statistics.median(times) * 1000, 3), 'queries': len(queries)}
+
+
+def run(rows, number, repeat):
+    results = {
+        'meta': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'cache': settings.CACHES['default']['BACKEND'],
+            'objects': OBJECTS,
+            'number': number,
+            'repeat': repeat,
+        },
+        'cells': {},
+        'decorators': {},
+        'changelists': {},
+    }
+
+    seed(min(rows))
+    cache.clear()
+    for name, model, field in fields():
+        results['cells'][name] = measure_cells(field, objects(model), number, repeat)
+        print('%-36s %10.3f us %8.3f queries' % ((name,) + tuple(results['cells'][name].values())))
+
+    questions = objects(Question)
+    for name, method in decorators():
+        results['decorators'][name] = measure_cells(lambda obj: method(None, obj), questions, number, repeat)
+        print('%-36s %10.3f us %8.3f queries' % ((name,) + tuple(results['decorators'][name].values())))
+
+    client = Client()
+    client.force_login(User.objects.create(username='benchmark', is_staff=True, is_superuser=True))
+    for size in rows:
+        seed(size)
+        for admin, url in (
+            ('QuestionAdmin', '/admin/test_app/question/'),
+            ('PollAdmin', '/admin/test_app/poll/'),
+            ('TagAdmin', '/admin/test_app/tag/'),
+        ):
+            name = '%s@%s' % (admin, size)
+            cache.clear()
+            results['changelists'][name] = measure_changelist(client, url, repeat)
+            print('%-36s %10.3f ms %8d queries' % ((name,) + tuple(results['changelists'][name].values())))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the results next to the baseline.
+
+    Returns:
+        list: The names of the regressions, slower by more than the threshold or with more queries.
+    """
+    regressions = []
+    print('\n%-48s %12s %12s %8s %9s' % ('benchmark', 'baseline', 'current', 'change', 'queries'))
+    for group in ('cells', 'decorators', 'changelists'):
+        for name, current in results[group].items():
+            previous = baseline.get(group, {}).get(name)
+            if previous is None:
+                continue
+
+            unit = 'ms' if group == 'changelists' else 'us'
+            change = current[unit] / previous[unit] - 1 if previous[unit] else 0
+            regression = change > threshold or current['queries'] > previous['queries']
+            if regression:
+                regressions.append('%s.%s' % (group, name))
+            print('%-48s %12.3f %12.3f %+7.0f%% %4s->%-4s %s' % (
+                '%s.%s' % (group, name), previous[unit], current[unit], change * 100,
+                previous['queries'], current['queries'], 'REGRESSION' if regression else '',
+            ))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', default=','.join(map(str, ROWS)),
+                        help='numbers of rows of the changelists, comma separated (default: %(default)s)')
+    parser.add_argument('--number', type=int, default=20, help='renders of each cell (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='rounds of renders and requests of each changelist (default: %(default)s)')
+    parser.add_argument('--output', help='file to save the results, as JSON')
+    parser.add_argument('--baseline', help='results to compare with, as JSON')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='slowdown allowed against the baseline (default: %(default)s)')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+    results = run(sorted(int(size) for size in args.rows.split(',')), args.number, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            regressions = compare(results, json.load(baseline), args.threshold)
+        if regressions:
+            print('\n%d regressions' % len(regressions))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,5 +5,5 @@ from .admin.field import (  # noqa
     ModelImageField, FilterAdminField, CacheAdminField, FormatAdminField
 )
 from .admin.decorators import action, short, smart, with_tags, utils, filter, cache, clear_cache  # noqa
-from .admin.mixin import MixinEasyViews  # noqa
+from .admin.mixin import MixinEasyViews, MixinEasyFields  # noqa
 from .util import action_response  # noqa
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import math
+import random
+import time
 from dataclasses import asdict
 from functools import wraps
-from typing import Optional, Callable, Union, List
+from typing import Optional, Callable, Union, List, Any, Dict, Iterable, Tuple
 
 from django import utils as django_utils
 from django.core.cache import cache as django_cache
 from django.utils.safestring import mark_safe
 
-from easy import helper
+from easy import helper, instrumentation
 
 Model: "django.db.models.Model"
 
@@ -33,7 +36,7 @@ def smart(**kwargs):
     def decorator(func):
         for key, value in kwargs.items():
             setattr(func, key, value)
-        return func
+        return instrumentation.instrument(func)
 
     return decorator
 
@@ -65,22 +68,35 @@ def short(**kwargs: Union[str, bool]) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
                 return mark_safe(func(*args, **kwargs))
-            return wrapper
-        return func
+            return instrumentation.instrument(wrapper)
+        return instrumentation.instrument(func)
 
     return decorator
 
 
-def action(short_description: str, permission: Optional[Union[str, List[str]]] = None) -> Callable:
+def action(
+    short_description: str,
+    permission: Optional[Union[str, List[str]]] = None,
+    background: bool = False,
+) -> Callable:
     """
     Action decorator to set some attrs on admin method.
 
+    With `background`, the pks of the selected objects are handed to the executor of easy.jobs, and the action
+    is called later as `action(self, job, objects)`, with an iterator of the objects loaded by chunks,
+    reporting its progress with `job.progress(done)`.
+    The user is redirected at once, with a message linking to the state of the job,
+    served by the `job` easy view of MixinEasyViews.
+
     :param short_description: description of custom field (str)
     :param permission: permission to use. (Optional[Union[str, List[str]]])
+    :param background: run the action in the background. (bool)
     :return: method decorated (Callable)
     """
 
     def decorator(func: Callable) -> Callable:
+        if background:
+            func = _background_action(func)
         func.short_description = short_description
         if permission:
             if isinstance(permission, str):
@@ -92,6 +108,19 @@ def action(short_description: str, permission: Optional[Union[str, List[str]]] =
     return decorator
 
 
+def _background_action(func: Callable) -> Callable:
+    from easy import jobs
+    from easy.util import action_response
+
+    @wraps(func)
+    def wrapper(admin, request, queryset):
+        job = jobs.start_job(admin, func.__name__, request.user.pk, list(queryset.values_list('pk', flat=True)))
+        return action_response(request, 'Action started in the background.', job=job.id)
+
+    wrapper.background = func
+    return wrapper
+
+
 def utils(django_utils_function: str) -> Callable[[Callable], Callable]:
     """
     Util decorator to apply a django.utils function on the method result.
@@ -149,41 +178,205 @@ def with_tags():
     return decorator
 
 
-def cache(seconds: int = 60):
+def cache(seconds: int = 60, depends: Optional[Iterable[str]] = None, lock: bool = False, beta: float = 0):
     """
     Cache decorator to cache the result of a method.
 
+    Values are cached by object, under
+    `easy.<app_label>.<model_name>.<method qualified name>.<pk>.<model generation>.<object generation>`.
+    Clearing the cache increments a generation, so the old values are no longer read and expire.
+    On changelists of admins with MixinEasyFields, all rows of the page are read with one `get_many`
+    and the missing ones are written with one `set_many`.
+    Values are stored as `(value, expires, compute time)`, so falsy results, and None, are cached too.
+
+    With `depends`, the values of an object are cleared when it is saved or deleted, or when a related object
+    reached by one of the paths is saved, deleted or added to or removed from a many-to-many relation.
+
+    With `lock`, values are kept twice as long, and once expired only the worker that gets the lock, with an atomic
+    `add`, recomputes it, while the others keep serving the expired value.
+    With `beta`, values are recomputed early, more likely the closer they are to expire and the longer they took
+    to compute (XFetch), so the refreshes of a page spread out before the cache time ends. 1 is a good start.
+
     :param seconds: The cache time in seconds. (int)
+    :param depends: Paths of the related objects the value depends on, like `poll` or `question_set`.
+        An empty tuple depends on the object only. (Optional[Iterable[str]])
+    :param lock: Recompute expired values in one worker only, serving them meanwhile. (bool)
+    :param beta: Early recomputation factor, 0 to recompute at expiration only. (float)
     :return: The cached method
     """
 
     def decorator(func: Callable) -> Callable:
+        registered = set()
+        timeout = seconds * 2 if lock else seconds
+
+        def register(model_class: type) -> None:
+            if depends is not None and model_class not in registered:
+                from easy import signals
+                signals.register(model_class, depends)
+                registered.add(model_class)
+
+        def resolve(admin, obj, key: str, entry: Any) -> Tuple[Any, Optional[tuple], bool]:
+            # the value, the entry to store, and if the recompute lock was taken
+            if is_cache_entry(entry):
+                instrumentation.count_cache(1, 0)
+                value, expires, delta = entry
+                if not should_recompute(expires, delta, beta):
+                    return value, None, False
+                if lock and not django_cache.add(key + '.lock', True, seconds):
+                    return value, None, False
+
+            else:
+                instrumentation.count_cache(0, 1)
+
+            start = time.monotonic()
+            value = func(admin, obj)
+            now = time.monotonic()
+            return value, (value, time.time() + seconds, now - start), lock and is_cache_entry(entry)
+
         @wraps(func)
         def wrapper(admin, model):
-            cache_method_key = helper.cache_method_key(model, func.__name__)
-            value = django_cache.get(cache_method_key)
-            if not value:
-                value = func(admin, model)
-                cache_object_key = helper.cache_object_key(model)
-                obj_methods_caches = django_cache.get(cache_object_key) or ''
-                django_cache.set_many({
-                    cache_method_key: value,
-                    cache_object_key: obj_methods_caches + '|' + cache_method_key
-                }, seconds)
+            value = helper.get_memoized(wrapper, model)
+            if value is not helper.NOTHING:
+                return value
+
+            register(type(model))
+
+            version = get_cache_versions([model])[model.pk]
+            cache_method_key = helper.cache_method_key(model, func.__qualname__, version)
+            cached = cache_get_many([cache_method_key])
+            value, entry, locked = resolve(admin, model, cache_method_key, cached.get(cache_method_key))
+            if entry is not None:
+                cache_set_many({cache_method_key: entry}, timeout)
+            if locked:
+                django_cache.delete(cache_method_key + '.lock')
             return value
 
-        return wrapper
+        def prepare(admin, objs):
+            for model_class in {type(obj) for obj in objs}:
+                register(model_class)
+
+            versions = get_cache_versions(objs)
+            keys = {obj.pk: helper.cache_method_key(obj, func.__qualname__, versions[obj.pk]) for obj in objs}
+            cached = cache_get_many(keys.values())
+
+            values = {}
+            missing = {}
+            locks = []
+            for obj in objs:
+                key = keys[obj.pk]
+                values[obj.pk], entry, locked = resolve(admin, obj, key, cached.get(key))
+                if entry is not None:
+                    missing[key] = entry
+                if locked:
+                    locks.append(key + '.lock')
+
+            if missing:
+                cache_set_many(missing, timeout)
+            if locks:
+                django_cache.delete_many(locks)
+            helper.memoize_many(wrapper, objs, values)
+
+        wrapper.prepare = prepare
+        wrapper.register = register
+        wrapper.depends = tuple(depends) if depends is not None else None
+        return instrumentation.instrument(wrapper)
     return decorator
 
 
-def clear_cache(model: Model) -> None:
+def cache_get_many(keys: Iterable[str]) -> Dict[str, Any]:
+    """
+    Reads values from the request-local cache, and the missing ones from the Django cache with one `get_many`.
+
+    :param keys: The cache keys.
+    :return: The values found, by key
+    """
+    keys = list(keys)
+    values = helper.local_get_many(keys)
+    missing = [key for key in keys if key not in values]
+    if missing:
+        found = django_cache.get_many(missing)
+        # misses are kept too, a generation never incremented is not read again
+        helper.local_set_many({key: found.get(key, helper.NOTHING) for key in missing})
+        values.update(found)
+    return {key: value for key, value in values.items() if value is not helper.NOTHING}
+
+
+def cache_set_many(values: Dict[str, Any], timeout: Optional[int]) -> None:
+    """
+    Writes values to the Django cache, with one `set_many`, and to the request-local cache.
+
+    :param values: The values by cache key.
+    :param timeout: The cache time in seconds.
+    """
+    django_cache.set_many(values, timeout)
+    helper.local_set_many(values)
+
+
+def is_cache_entry(entry: Any) -> bool:
+    """
+    Checks if a value read from the cache is an entry stored by the cache decorator.
+
+    :param entry: The value read from the cache, None on a miss.
+    :return: True if it is a `(value, expires, compute time)` entry
+    """
+    return isinstance(entry, tuple) and len(entry) == 3
+
+
+def should_recompute(expires: float, delta: float, beta: float = 0) -> bool:
+    """
+    Decides if a cached value is recomputed, at expiration, or early with probabilistic early expiration (XFetch).
+
+    :param expires: The timestamp the value expires at. (float)
+    :param delta: The time the value took to compute, in seconds. (float)
+    :param beta: Early recomputation factor, 0 to recompute at expiration only. (float)
+    :return: True if the value must be recomputed
+    """
+    if beta:
+        # -log(u) is exponentially distributed, 1 - random() avoids log(0)
+        return time.time() - delta * beta * math.log(1.0 - random.random()) >= expires
+    return time.time() >= expires
+
+
+def get_cache_versions(objs: Iterable[Model]) -> Dict[Any, str]:
+    """
+    Reads, with one `get_many`, the generations of the objects and of their models.
+
+    A generation never incremented is read as `n`.
+
+    :param objs: The model instances.
+    :return: `<model generation>.<object generation>` by object pk
+    """
+    keys = {obj.pk: (helper.cache_model_key(obj), helper.cache_object_key(obj)) for obj in objs}
+    generations = cache_get_many({key for pair in keys.values() for key in pair})
+    return {
+        pk: '%s.%s' % (generations.get(model_key, 'n'), generations.get(object_key, 'n'))
+        for pk, (model_key, object_key) in keys.items()
+    }
+
+
+def incr_cache_generation(key: str) -> None:
+    """
+    Increments a generation, with one atomic `incr`.
+
+    :param key: The cache key of the generation.
+    """
+    helper.local_delete(key)
+    try:
+        django_cache.incr(key)
+    except ValueError:
+        # time based, so a generation created again after being evicted does not repeat an old one
+        if not django_cache.add(key, int(time.time() * 1000), None):
+            django_cache.incr(key)
+
+
+def clear_cache(model: Union[Model, type]) -> None:
     """
-    Clear cache for specific model.
+    Clear cache for specific model instance, or for all instances of a model class.
 
-    :param model: The model to clear cache for.
-    :type model: django.db.models.Model
+    :param model: The model instance or class to clear cache for.
+    :type model: Union[django.db.models.Model, type]
     """
-    cache_object_key = helper.cache_object_key(model)
-    obj_methods_caches = django_cache.get(cache_object_key)
-    methods_key = obj_methods_caches.split('|') if obj_methods_caches else []
-    django_cache.delete_many(methods_key)
+    if isinstance(model, type):
+        incr_cache_generation(helper.cache_model_key(model))
+    else:
+        incr_cache_generation(helper.cache_object_key(model))
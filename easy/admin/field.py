@@ -1,17 +1,20 @@
-from typing import Optional, Union, List, Any, Dict
+from string import Formatter
+from typing import Optional, Union, List, Any, Dict, Tuple
 
-from django.contrib.admin.templatetags.admin_urls import admin_urlname
-from django.db.models import Model, ImageField as ModelImageField, ForeignKey
 from django.conf import settings
+from django.contrib.admin.templatetags.admin_urls import admin_urlname
+from django.db.models import Model, ImageField as ModelImageField, ForeignKey, Count
+from django.db.models.fields.files import FieldFile
 from django.forms.utils import flatatt
 from django.urls import reverse
-from django.utils.html import conditional_escape
-from django.template.loader import render_to_string
+from django.utils.html import conditional_escape, format_html
+from django.template import Context, Template
 from django.utils.http import urlencode
 from django.utils.safestring import mark_safe
-from .decorators import django_cache
 
-from easy import helper
+from easy import helper, instrumentation
+from easy.admin.decorators import cache_get_many, cache_set_many, get_cache_versions
+from easy.thumbnails import EASY_CACHE_TEMPLATE_THUMBNAIL, get_thumbnail, thumbnail_stamp
 
 
 class BaseAdminField(object):
@@ -20,28 +23,231 @@ class BaseAdminField(object):
         self,
         short_description: str,
         admin_order_field: Optional[str] = None,
-        allow_tags: bool = False
+        allow_tags: bool = False,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
             Base Admin Field to be extended
+
+        With `cache`, the rendered values are kept on the Django cache, by field, object, version, language and
+        script prefix, for the `EASY_CACHE_TIMEOUT` setting in seconds, without expiration by default.
+        The version is the value of the `cache` attribute, like `updated_at`, or with `cache=True`,
+        the generations of the object and of its model (see easy.clear_cache and easy.cache depends).
+        The field is named by its admin attribute name, or by a hash of its options when declared inline.
+        Hits and misses are counted on `cache_stats`.
+
+        With `lazy`, the changelist renders a placeholder, and the values of all lazy fields of the page are
+        rendered by one request of the browser, to the `lazy` easy view of MixinEasyFields, so the page does not
+        wait for them. The field must be an attribute of an admin with MixinEasyFields and MixinEasyViews,
+        on `list_display` or `readonly_fields`; declared inline, it is rendered with the page.
+
         Args:
             short_description (str): The short description of the admin field.
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
             allow_tags (bool): Whether to allow HTML tags in the rendered field.
+            cache (Optional[Union[bool, str]]): The attribute versioning the rendered value, or True to version it
+                by generations. Defaults to None, not cached.
+            lazy (bool): Renders a placeholder, filled after the page loads. Defaults to False. Not for boolean
+                fields, the admin renders their values as icons.
         """
+        if lazy and getattr(self, 'boolean', False):
+            raise ValueError('{} can not be lazy, boolean values are rendered as icons'.format(type(self).__name__))
         self.short_description = short_description
         if admin_order_field:
             self.admin_order_field = admin_order_field
         if allow_tags:
             self.allow_tags = allow_tags
+        self.cache = cache
+        self.lazy = lazy
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        self._name = None
+        self._cache_name = None
+        self._get_cache_version = helper.compile_accessor(cache) if isinstance(cache, str) else None
+        self._cache_registered = set()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        self._cache_name = '{}.{}'.format(owner.__name__, name)
 
     def render(self, obj):
         raise NotImplementedError()
 
+    def get_related_paths(self) -> List[str]:
+        """
+        Dotted attribute paths read by this field, used to plan select_related and prefetch_related.
+
+        Returns:
+            List[str]: The attribute paths.
+        """
+        return []
+
+    def get_annotations(self) -> Dict[str, Any]:
+        """
+        Annotations read by this field, to be added on the admin queryset.
+
+        Returns:
+            Dict[str, Any]: The annotation expressions by alias.
+        """
+        return {}
+
+    def render_many(self, objs: List[Model]) -> Optional[Dict[Any, Any]]:
+        """
+        Renders the field for a whole page of objects at once.
+
+        Args:
+            objs (List[Model]): The objects of the page.
+
+        Returns:
+            Optional[Dict[Any, Any]]: The rendered values by object pk, or None if the field renders row by row.
+        """
+        return None
+
+    def prepare(self, objs: List[Model]) -> None:
+        """
+        Called once with all objects of a page before the per-row calls, so their values can be served
+        from a per-request memo.
+
+        Args:
+            objs (List[Model]): The objects of the page.
+        """
+        values = self.render_cached(objs) if self.cache else self.render_many(objs)
+        if values is not None:
+            helper.memoize_many(self, objs, values)
+
+    def get_cache_name(self) -> str:
+        """
+        Name of the field on cache keys, like `PollAdmin.count_question`.
+
+        Returns:
+            str: The admin attribute name, or the class name and a hash of the options of the field.
+        """
+        if self._cache_name is None:
+            options = sorted(
+                (key, getattr(value, '__qualname__', value)) for key, value in vars(self).items()
+                if not key.startswith('_') and key != 'cache_stats'
+            )
+            self._cache_name = '{}.{}'.format(type(self).__name__, helper.cache_version(repr(options), force_hash=True))
+        return self._cache_name
+
+    def get_cache_versions(self, objs: List[Model]) -> Dict[Any, str]:
+        """
+        Versions of the rendered values of the objects.
+
+        Args:
+            objs (List[Model]): The objects.
+
+        Returns:
+            Dict[Any, str]: The versions by object pk.
+        """
+        if self._get_cache_version is not None:
+            return {obj.pk: helper.cache_version(self._get_cache_version(obj)) for obj in objs}
+
+        for model in {type(obj) for obj in objs} - self._cache_registered:
+            # fields declared inline, not registered by MixinEasyFields
+            self.register_cache(model)
+        return get_cache_versions(objs)
+
+    def get_cache_key_name(self) -> str:
+        """
+        Name of the field on the keys of its cached values, with the active language and script prefix,
+        the rendered urls and text depend on them.
+
+        Returns:
+            str: The cache name, language and a hash of the script prefix.
+        """
+        return '{}.{}'.format(self.get_cache_name(), helper.cache_locale())
+
+    def get_cache_timeout(self) -> Optional[int]:
+        """
+        Returns:
+            Optional[int]: The cache time of the values in seconds, the `EASY_CACHE_TIMEOUT` setting,
+            or None to never expire.
+        """
+        return getattr(settings, 'EASY_CACHE_TIMEOUT', None)
+
+    def register_cache(self, model: type) -> None:
+        """
+        Connects the signals incrementing the generation of an object of the model when it is saved or deleted,
+        for `cache=True`. MixinEasyFields registers its fields at startup, so every process bumps generations.
+
+        Args:
+            model (type): The model of the rendered objects.
+        """
+        from easy import signals
+
+        signals.register(model)
+        self._cache_registered.add(model)
+
+    def render_cached(self, objs: List[Model]) -> Dict[Any, Any]:
+        """
+        Renders the field for objects, reading the values from the cache with one `get_many` and writing
+        the missing ones with one `set_many`.
+
+        Args:
+            objs (List[Model]): The objects.
+
+        Returns:
+            Dict[Any, Any]: The rendered values by object pk.
+        """
+        versions = self.get_cache_versions(objs)
+        name = self.get_cache_key_name()
+        keys = {obj.pk: helper.cache_method_key(obj, name, versions[obj.pk]) for obj in objs}
+        cached = cache_get_many(keys.values())
+
+        values = {}
+        missing = []
+        for obj in objs:
+            entry = cached.get(keys[obj.pk])
+            if isinstance(entry, tuple):
+                values[obj.pk] = entry[0]
+            else:
+                missing.append(obj)
+
+        self.cache_stats['hits'] += len(values)
+        self.cache_stats['misses'] += len(missing)
+        instrumentation.count_cache(len(values), len(missing))
+        if missing:
+            rendered = self.render_many(missing)
+            if rendered is None:
+                rendered = {obj.pk: self.render(obj) for obj in missing}
+            values.update(rendered)
+            cache_set_many({keys[obj.pk]: (rendered[obj.pk],) for obj in missing}, self.get_cache_timeout())
+        return values
+
+    def render_placeholder(self, obj: Model) -> str:
+        """
+        Placeholder of a lazy field, filled by `easy/js/lazy.js`.
+
+        Args:
+            obj (Model): The model instance.
+
+        Returns:
+            str: The placeholder, with the url of the lazy easy view, the field name and the object pk.
+        """
+        opts = obj._meta
+        return format_html(
+            '<span class="easy-lazy" data-easy-url="{}" data-easy-field="{}" data-easy-pk="{}">&hellip;</span>',
+            helper.reverse_cached('admin:%s_%s_easy_lazy' % (opts.app_label, opts.model_name)), self._name, obj.pk,
+        )
+
     def __call__(self, obj):
+        if self.lazy and self._name is not None:
+            return self.render_placeholder(obj)
+        if instrumentation.is_active():
+            return instrumentation.call(self.get_cache_name(), self.render_cell, obj)
+        return self.render_cell(obj)
+
+    def render_cell(self, obj):
+        """
+        Renders the field for an object, from the values of prepare, or the cache, if any.
+        """
+        value = helper.get_memoized(self, obj)
+        if value is helper.NOTHING:
+            value = self.render_cached([obj])[obj.pk] if self.cache else self.render(obj)
         if getattr(self, 'allow_tags', False):
-            return mark_safe(self.render(obj))
-        return self.render(obj)
+            return mark_safe(value)
+        return value
 
 
 class SimpleAdminField(BaseAdminField):
@@ -52,7 +258,9 @@ class SimpleAdminField(BaseAdminField):
         short_description: Optional[str] = None,
         admin_order_field: Optional[str] = None,
         allow_tags: bool = False,
-        default: Optional[str] = None
+        default: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field that renders the value of the specified attribute.
@@ -66,9 +274,12 @@ class SimpleAdminField(BaseAdminField):
             allow_tags (bool): Whether to allow HTML tags in the rendered field.
             default (Optional[str]): The default value to render if the attribute is None.
                 If a callable, the callable will be called with no arguments and its return value will be rendered.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.attr = attr
         self.default = default
+        self._get = helper.compile_accessor(attr, default)
 
         if callable(attr):
             assert short_description
@@ -77,10 +288,13 @@ class SimpleAdminField(BaseAdminField):
 
         short_description = short_description or attr.split('.')[-1]
 
-        super(SimpleAdminField, self).__init__(short_description, admin_order_field, allow_tags)
+        super(SimpleAdminField, self).__init__(short_description, admin_order_field, allow_tags, cache, lazy)
 
     def render(self, obj):
-        return helper.call_or_get(obj, self.attr, self.default)
+        return self._get(obj)
+
+    def get_related_paths(self) -> List[str]:
+        return [] if callable(self.attr) else [self.attr]
 
 
 class BooleanAdminField(SimpleAdminField):
@@ -89,18 +303,22 @@ class BooleanAdminField(SimpleAdminField):
         self,
         attr: str,
         short_description: Optional[str] = None,
-        admin_order_field: Optional[str] = None
+        admin_order_field: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
     ) -> None:
         """
-        Admin field that renders a boolean icon for the value.
+        Admin field that renders a boolean icon for the value. It can not be lazy, the admin renders the icon.
 
         Args:
             attr (str): The attribute to render.
             short_description (Optional[str]): The short description of the field.
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
         """
         self.boolean = True
-        super(BooleanAdminField, self).__init__(attr, short_description, admin_order_field, False, False)
+        super(BooleanAdminField, self).__init__(
+            attr, short_description, admin_order_field, False, False, cache
+        )
 
     def render(self, obj):
         return bool(super(BooleanAdminField, self).render(obj))
@@ -115,6 +333,8 @@ class ForeignKeyAdminField(SimpleAdminField):
         short_description: Optional[str] = None,
         admin_order_field: Optional[str] = None,
         default: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for displaying foreign key with link to change related object.
@@ -127,28 +347,38 @@ class ForeignKeyAdminField(SimpleAdminField):
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
             default (Optional[str]): The default value to display if the foreign key attribute
                 is None. Defaults to None.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.display = display
-        super().__init__(attr, short_description, admin_order_field, True, default)
+        self._get_display = helper.compile_accessor(display, default) if display else None
+        super().__init__(attr, short_description, admin_order_field, True, default, cache, lazy)
 
     def render(self, obj):
-        ref = helper.call_or_get(obj, self.attr, self.default)
+        ref = self._get(obj)
         display = None
-        if self.display:
-            display = helper.call_or_get(obj, self.display, self.default)
+        if self._get_display:
+            display = self._get_display(obj)
 
         display = display or ref
         if isinstance(ref, Model):
             return '<a href="%s">%s</a>' % (
-                reverse(
-                    admin_urlname(ref._meta, 'change'),
-                    args=(ref.pk,)
-                ),
+                helper.reverse_cached(admin_urlname(ref._meta, 'change'), ref.pk),
                 conditional_escape(display or ref)
             )
 
         return self.default
 
+    def render_many(self, objs):
+        helper.prefetch_paths(objs, self.get_related_paths())
+        return {obj.pk: self.render(obj) for obj in objs}
+
+    def get_related_paths(self) -> List[str]:
+        paths = super().get_related_paths()
+        if self.display and not callable(self.display):
+            paths.append(self.display)
+        return paths
+
 
 class RawIdAdminField(SimpleAdminField):
 
@@ -158,6 +388,8 @@ class RawIdAdminField(SimpleAdminField):
         short_description: Optional[str] = None,
         admin_order_field: Optional[str] = None,
         default: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for displaying raw id of foreign key.
@@ -168,25 +400,38 @@ class RawIdAdminField(SimpleAdminField):
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
             default (Optional[str]): The default value to display if the foreign key attribute
                 is None. Defaults to None.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
-        super(RawIdAdminField, self).__init__(attr, short_description, admin_order_field, True, default)
+        super(RawIdAdminField, self).__init__(
+            attr, short_description, admin_order_field, True, default, cache, lazy
+        )
 
     def render(self, obj):
-        field = obj._meta.get_field(self.attr)
+        return self._render(obj, obj._meta.get_field(self.attr))
+
+    def render_many(self, objs):
+        if not objs:
+            return {}
+        field = objs[0]._meta.get_field(self.attr)
+        return {obj.pk: self._render(obj, field) for obj in objs}
 
+    def _render(self, obj, field):
         if isinstance(field, ForeignKey):
             meta = field.related_model._meta
             id = getattr(obj, field.attname)
             return '<a href="%s">%s</a>' % (
-                reverse(
-                    admin_urlname(meta, 'change'),
-                    args=(id,)
-                ),
+                helper.reverse_cached(admin_urlname(meta, 'change'), id),
                 conditional_escape(id)
             )
 
         return self.default
 
+    def get_related_paths(self) -> List[str]:
+        # only the id column is used, there is nothing to join
+        return []
+
+
 class GenericForeignKeyAdminField(SimpleAdminField):
 
     def __init__(
@@ -196,7 +441,9 @@ class GenericForeignKeyAdminField(SimpleAdminField):
         admin_order_field: Optional[str] = None,
         default: Optional[str] = None,
         cache_content_type: bool = False,
-        related_attr: Optional[str] = None
+        related_attr: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for displaying generic foreign key with link to change related object.
@@ -210,20 +457,25 @@ class GenericForeignKeyAdminField(SimpleAdminField):
             cache_content_type (bool): Whether to cache the content type. Defaults to False.
             related_attr (Optional[str]): The attribute to display instead of the foreign key
                 attribute of related object. Defaults to None.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.cache_content_type = cache_content_type
         self.related_attr = related_attr
+        self._get_related = helper.compile_accessor(related_attr, default) if related_attr else None
         super(GenericForeignKeyAdminField, self).__init__(
             attr,
             short_description,
             admin_order_field,
             True,
-            default
+            default,
+            cache,
+            lazy,
         )
 
     def render(self, obj):
         from django.contrib.contenttypes.fields import GenericForeignKey
-        ct = None
+        from django.contrib.contenttypes.models import ContentType
         field = obj._meta.get_field(self.attr)
 
         if not isinstance(field, GenericForeignKey):
@@ -234,34 +486,86 @@ class GenericForeignKeyAdminField(SimpleAdminField):
             return self.default
 
         if self.cache_content_type:
-            key = helper.EASY_CACHE_TEMPLATE_OBJ.format(
-                'content-type',
-                getattr(obj, f"{field.ct_field}_id")
+            # process-local cache of ContentType, no query or cache round-trip after the first time
+            ct = ContentType.objects.db_manager(obj._state.db).get_for_id(
+                getattr(obj, obj._meta.get_field(field.ct_field).attname)
             )
-            ct = django_cache.get(key)
-            if not ct:
-                ct = getattr(obj, field.ct_field)
-                django_cache.set(key, ct)
+        else:
+            ct = getattr(obj, field.ct_field)
 
-        if self.related_attr:
-            if self.cache_content_type:
-                related = ct.get_object_for_this_type(pk=pk)
-            else:
+        related = None
+        if self.related_attr and self.cache_content_type and ct.model_class() is not None:
+            # related objects are kept on the request-local cache, when enabled
+            key = ('easy.generic', obj._state.db, ct.pk, ct.model_class()._meta.pk.to_python(pk))
+            related = helper.local_get_many([key]).get(key, helper.NOTHING)
+            if related is helper.NOTHING:
                 related = getattr(obj, self.attr)
-            display = helper.call_or_get(related, self.related_attr, self.default)
+                helper.local_set_many({key: related})
+        elif self.related_attr:
+            related = getattr(obj, self.attr)
+        return self._render(pk, ct, related)
+
+    def render_many(self, objs):
+        """
+        Rows are grouped by content type, each content type is taken from the process-local cache of ContentType
+        and, with related_attr, its objects are fetched with one in_bulk.
+        With cache_content_type, related objects are also kept on the request-local cache.
+        """
+        from django.contrib.contenttypes.fields import GenericForeignKey
+        from django.contrib.contenttypes.models import ContentType
+
+        values = {obj.pk: self.default for obj in objs}
+        if not objs:
+            return values
+
+        opts = objs[0]._meta
+        field = opts.get_field(self.attr)
+        if not isinstance(field, GenericForeignKey):
+            return values
+
+        ct_attname = opts.get_field(field.ct_field).attname
+        groups = {}
+        for obj in objs:
+            if getattr(obj, field.fk_field):
+                groups.setdefault(getattr(obj, ct_attname), []).append(obj)
+
+        db = objs[0]._state.db
+        for ct_id, group in groups.items():
+            ct = ContentType.objects.db_manager(db).get_for_id(ct_id)
+            model = ct.model_class()
+            related = {}
+            if self.related_attr and model is not None:
+                pks = {model._meta.pk.to_python(getattr(obj, field.fk_field)) for obj in group}
+                cached = helper.local_get_many(('easy.generic', db, ct_id, pk) for pk in pks)
+                related = {key[3]: value for key, value in cached.items()}
+                missing = pks - set(related)
+                if missing:
+                    fetched = model._base_manager.using(db).in_bulk(missing)
+                    related.update(fetched)
+                    if self.cache_content_type:
+                        helper.local_set_many({('easy.generic', db, ct_id, pk): fetched.get(pk) for pk in missing})
+
+            for obj in group:
+                pk = getattr(obj, field.fk_field)
+                values[obj.pk] = self._render(pk, ct, related.get(model._meta.pk.to_python(pk)) if related else None)
+
+        return values
+
+    def _render(self, pk, ct, related):
+        if self.related_attr:
+            display = self._get_related(related)
         else:
             display = pk
 
-        if not ct:
-            ct = getattr(obj, field.ct_field)
         return '<a href="%s">%s</a>' % (
-            reverse(
-                'admin:%s_%s_change' % (ct.app_label, ct.model),
-                args=(pk,)
-            ),
+            helper.reverse_cached('admin:%s_%s_change' % (ct.app_label, ct.model), pk),
             "%s | %s" % (display, ct.name)
         )
 
+    def get_related_paths(self) -> List[str]:
+        # content types and related objects are loaded by render_many, grouped by content type
+        return []
+
 
 class LinkChangeListAdminField(BaseAdminField):
 
@@ -274,10 +578,16 @@ class LinkChangeListAdminField(BaseAdminField):
         params_static: Optional[Dict[str, str]] = None,
         short_description: Optional[str] = None,
         admin_order_field: Optional[str] = None,
+        count: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for displaying link to change list filtered by some parameters in the URL.
 
+        With `count`, the related objects are counted by an annotation on the admin queryset (see MixinEasyFields),
+        the text is read from it and the column is sorted by it.
+
         Args:
             app (str): The Django app label.
             model (str): The Django model name.
@@ -285,28 +595,61 @@ class LinkChangeListAdminField(BaseAdminField):
             params (Optional[Dict[str, str]]): The parameters to include in the URL.
             params_static (Optional[Dict[str, str]]): The static parameters to include in the URL.
             short_description (Optional[str]): The short description of the field.
-            admin_order_field (Optional[str]): The field to order by when clicked in the admin.
+            admin_order_field (Optional[str]): The field to order by when clicked in the admin. Defaults to the
+                count annotation when `count` is used.
+            count (Optional[str]): The reverse relation to count, as used on lookups, like `question`.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.app = app
         self.model = model
         self.attr = attr
         self.params = params or {}
         self.params_static = params_static or {}
-        super(LinkChangeListAdminField, self).__init__(short_description or model, admin_order_field, True)
+        self.count = count
+        self.count_annotation = None
+        if count:
+            self.count_annotation = 'easy_count_%s' % count.replace('__', '_')
+            admin_order_field = admin_order_field or self.count_annotation
+        self._viewname = 'admin:%s_%s_changelist' % (app, model)
+        self._get_text = helper.compile_accessor(attr)
+        self._get_params = [(key, helper.compile_accessor(value)) for key, value in self.params.items()]
+        super(LinkChangeListAdminField, self).__init__(
+            short_description or model, admin_order_field, True, cache, lazy
+        )
 
     def render(self, obj):
-        text = helper.call_or_get(obj, self.attr)
+        text = helper.NOTHING
+        if self.count_annotation:
+            text = getattr(obj, self.count_annotation, helper.NOTHING)
+        if text is helper.NOTHING:
+            text = self._get_text(obj)
         p_params = {}
-        for key in self.params.keys():
-            p_params[key] = helper.call_or_get(obj, self.params[key])
+        for key, get in self._get_params:
+            p_params[key] = get(obj)
 
         p_params.update(self.params_static)
 
         return '<a href="%s">%s</a>' % (
-            reverse('admin:%s_%s_changelist' % (self.app, self.model)) + '?' + urlencode(p_params),
+            helper.reverse_cached(self._viewname) + '?' + urlencode(p_params),
             conditional_escape(text)
         )
 
+    def render_many(self, objs):
+        helper.prefetch_paths(objs, self.get_related_paths())
+        return {obj.pk: self.render(obj) for obj in objs}
+
+    def get_related_paths(self) -> List[str]:
+        paths = list(self.params.values())
+        if not self.count:
+            paths.insert(0, self.attr)
+        return [path for path in paths if not callable(path)]
+
+    def get_annotations(self) -> Dict[str, Any]:
+        if self.count:
+            return {self.count_annotation: Count(self.count, distinct=True)}
+        return {}
+
 
 class ExternalLinkAdminField(BaseAdminField):
     # todo : test with this one
@@ -319,7 +662,11 @@ class ExternalLinkAdminField(BaseAdminField):
             self.args = args if isinstance(args, (list, tuple)) else (args,)
         else:
             self.args = None
-        super(ExternalLinkAdminField, self).__init__(short_description, kwargs.get('admin_order_field'), True)
+        self._get_ref = None if attr == 'self' else helper.compile_getter(attr)
+        self._get_args = [helper.compile_getter(arg) for arg in self.args or []]
+        super(ExternalLinkAdminField, self).__init__(
+            short_description, kwargs.get('admin_order_field'), True, kwargs.get('cache'), kwargs.get('lazy', False)
+        )
 
     def render(self, obj):
         if self.attr == 'self':
@@ -328,24 +675,29 @@ class ExternalLinkAdminField(BaseAdminField):
             else:
                 assert self.link
                 if self.args:
-                    p_args = [helper.deep_getattribute(obj, arg) for arg in self.args]
+                    p_args = [get(obj) for get in self._get_args]
                 else:
                     p_args = None
                 return reverse(self.link, args=p_args)
 
         if not self.link:
-            return helper.deep_getattribute(obj, self.attr).get_absolute_url()
+            return self._get_ref(obj).get_absolute_url()
 
         assert self.link
-        ref = helper.deep_getattribute(obj, self.attr)
+        ref = self._get_ref(obj)
 
         if self.args:
-            p_args = [helper.deep_getattribute(ref, arg) for arg in self.args]
+            p_args = [get(ref) for get in self._get_args]
         else:
             p_args = None
 
         return '<a href=%s>%s</a>' % (reverse(self.link, args=p_args), self.text)
 
+    def get_related_paths(self) -> List[str]:
+        if self.attr == 'self':
+            return list(self.args or [])
+        return [self.attr] + ['%s.%s' % (self.attr, arg) for arg in self.args or []]
+
 
 class TemplateAdminField(BaseAdminField):
 
@@ -355,6 +707,8 @@ class TemplateAdminField(BaseAdminField):
         context: Optional[Dict[str, Any]] = None,
         short_description: Optional[str] = 'without_name',
         admin_order_field: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for rendering a template.
@@ -364,15 +718,33 @@ class TemplateAdminField(BaseAdminField):
             context (Optional[Dict[str, Any]]): The context to pass to the template. Defaults to None.
             short_description (Optional[str]): The short description of the field. Defaults to 'without_name'.
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.context = context or {}
         self.template = template
-        super(TemplateAdminField, self).__init__(short_description, admin_order_field, True)
+        super(TemplateAdminField, self).__init__(short_description, admin_order_field, True, cache, lazy)
 
     def render(self, obj):
-        context = self.context.copy()
-        context.update({'obj': obj})
-        return render_to_string(self.template, context)
+        return self.render_many([obj])[obj.pk]
+
+    def render_many(self, objs):
+        """
+        The template is resolved once, and the rows are rendered in one pass over one Context,
+        with the object pushed on it for each row.
+        """
+        template = helper.get_template(self.template)
+        compiled = getattr(template, 'template', None)
+        if not isinstance(compiled, Template):
+            # other template backends
+            return {obj.pk: template.render(dict(self.context, obj=obj)) for obj in objs}
+
+        context = Context(self.context, autoescape=compiled.engine.autoescape)
+        values = {}
+        for obj in objs:
+            with context.push(obj=obj):
+                values[obj.pk] = compiled.render(context)
+        return values
 
 
 class ImageAdminField(BaseAdminField):
@@ -382,37 +754,134 @@ class ImageAdminField(BaseAdminField):
         attr: str,
         params: Optional[Dict[str, str]] = None,
         short_description: Optional[str] = None,
-        admin_order_field: Optional[str] = None
+        admin_order_field: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        thumbnail: Optional[Tuple[int, int]] = None,
+        thumbnail_scales: Tuple[int, ...] = (1, 2),
+        lazy: bool = False,
     ) -> None:
         """
         Admin field for rendering an image.
 
+        With `thumbnail`, the image is resized to fit in the box, keeping its aspect ratio, by the first render
+        and saved on its storage (see easy.thumbnails). The thumbnail urls and sizes are kept on the cache
+        by the modification time of the image, read with one `get_many` for a page, and the image is rendered
+        with `width`, `height`, `loading="lazy"`, and a `srcset` with a thumbnail by scale, for high density screens.
+
         Args:
             attr (str): The attribute containing the image path.
             params (Optional[Dict[str, str]]): The additional parameters to include in the image tag. Defaults to None.
             short_description (Optional[str]): The short description of the field. Defaults to None.
             admin_order_field (Optional[str]): The field to order by when clicked in the admin. Defaults to None.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            thumbnail (Optional[Tuple[int, int]]): The maximum width and height of the thumbnail. Defaults to None.
+            thumbnail_scales (Tuple[int, ...]): The scales of the thumbnails on `srcset`. Defaults to (1, 2).
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.attr = attr
         self.params = params or {}
-        super().__init__(short_description or attr, admin_order_field, True)
+        self.thumbnail = tuple(thumbnail) if thumbnail else None
+        self.thumbnail_scales = tuple(thumbnail_scales)
+        self._get_src = helper.compile_accessor(attr)
+        self._get_params = [(key, helper.compile_accessor(value)) for key, value in self.params.items()]
+        super().__init__(short_description or attr, admin_order_field, True, cache, lazy)
 
     def render(self, obj):
-        src = helper.call_or_get(obj, self.attr)
+        if self.thumbnail:
+            return self.render_many([obj])[obj.pk]
 
-        if isinstance(src, ModelImageField):
-            src = settings.MEDIA_URL + src
+        src = self._get_src(obj)
+        if isinstance(src, FieldFile):
+            src = src.url if src else ''
 
-        p_params = {}
-        for key in self.params.keys():
-            p_params[key] = helper.call_or_get(obj, self.params[key])
+        return self.render_image(obj, {'src': src})
+
+    def render_many(self, objs):
+        """
+        The thumbnails of the page are read from the cache with one `get_many`, and the missing ones
+        made or found on the storage and written with one `set_many`.
+        """
+        if not self.thumbnail:
+            return None
 
-        p_params['src'] = src
+        files = {obj.pk: self._get_src(obj) for obj in objs}
+        thumbnails = self.get_thumbnails([file for file in files.values() if isinstance(file, FieldFile) and file])
+
+        values = {}
+        for obj in objs:
+            file = files[obj.pk]
+            if isinstance(file, FieldFile):
+                attrs = thumbnails[file.name] if file else {'src': ''}
+            else:
+                attrs = {'src': file}
+            values[obj.pk] = self.render_image(obj, attrs)
+        return values
+
+    def get_thumbnails(self, files: List[FieldFile]) -> Dict[str, Dict[str, Any]]:
+        """
+        Attributes of the image tags of the thumbnails of images.
+
+        Args:
+            files (List[FieldFile]): The images.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The `src`, `width`, `height` and `srcset` by image name.
+        """
+        width, height = self.thumbnail
+        keys = {}
+        stamps = {}
+        for file in files:
+            # a new image under the same name has a new stamp, so new keys and thumbnails
+            stamps[file.name] = thumbnail_stamp(file)
+            version = helper.cache_version('%s.%s' % (file.name, stamps[file.name]), force_hash=True)
+            for scale in self.thumbnail_scales:
+                keys[file.name, scale] = EASY_CACHE_TEMPLATE_THUMBNAIL.format(version, width * scale, height * scale)
+        cached = cache_get_many(keys.values())
+
+        missing = {}
+        for file in files:
+            for scale in self.thumbnail_scales:
+                key = keys[file.name, scale]
+                if key not in cached:
+                    cached[key] = get_thumbnail(file, width * scale, height * scale, stamps[file.name])
+                    if cached[key][1] is not None:
+                        missing[key] = cached[key]
+        if missing:
+            cache_set_many(missing, self.get_cache_timeout())
+
+        thumbnails = {}
+        for file in files:
+            src, src_width, src_height = cached[keys[file.name, self.thumbnail_scales[0]]]
+            attrs = thumbnails[file.name] = {'src': src}
+            if src_width is None:
+                continue
+
+            attrs['width'], attrs['height'] = src_width, src_height
+            srcset = []
+            for scale in self.thumbnail_scales:
+                scale_src, scale_width, _ = cached[keys[file.name, scale]]
+                # images smaller than the box of a scale are not enlarged
+                if scale_width and (scale == self.thumbnail_scales[0] or scale_width > src_width):
+                    srcset.append('%s %sx' % (scale_src, scale))
+            if len(srcset) > 1:
+                attrs['srcset'] = ', '.join(srcset)
+        return thumbnails
+
+    def render_image(self, obj: Model, attrs: Dict[str, Any]) -> str:
+        p_params = {'loading': 'lazy'} if self.thumbnail else {}
+        for key, get in self._get_params:
+            p_params[key] = get(obj)
+
+        p_params.update(attrs)
 
         return '<img%s/>' % (
             flatatt(p_params)
         )
 
+    def get_related_paths(self) -> List[str]:
+        paths = [self.attr] + list(self.params.values())
+        return [path for path in paths if not callable(path)]
+
 
 class FilterAdminField(SimpleAdminField):
 
@@ -426,6 +895,8 @@ class FilterAdminField(SimpleAdminField):
         admin_order_field: Optional[str] = None,
         allow_tags: bool = False,
         default: Optional[str] = None,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field that applies a Django filter to the field's value.
@@ -439,11 +910,13 @@ class FilterAdminField(SimpleAdminField):
             admin_order_field (Optional[str]): The field to order by when clicked in the admin.
             allow_tags (bool): Whether to allow HTML tags in the rendered field.
             default (Optional[str]): The default value to use.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.filter = django_filter
         self.load = load
         self.extra = extra
-        super().__init__(attr, short_description, admin_order_field, allow_tags, default)
+        super().__init__(attr, short_description, admin_order_field, allow_tags, default, cache, lazy)
 
     def render(self, obj):
         value = super(FilterAdminField, self).render(obj)
@@ -452,7 +925,7 @@ class FilterAdminField(SimpleAdminField):
         return filter_method(value, *args)
 
 
-class CacheAdminField(SimpleAdminField):
+class CacheAdminField(FilterAdminField):
 
     def __init__(
         self,
@@ -464,9 +937,18 @@ class CacheAdminField(SimpleAdminField):
         admin_order_field: Optional[str] = None,
         allow_tags: bool = False,
         default: Optional[str] = None,
+        timeout: Optional[int] = 60,
+        version: Optional[str] = None,
+        lazy: bool = False,
     ) -> None:
         """
-        Admin field that formats the value using a string format.
+        Admin field that applies a Django filter to the field's value, and caches the rendered value,
+        like the `cache` option of BaseAdminField, for `timeout` seconds.
+
+        Values are cached by object, and by the value of the version attribute, so an object saved with a new
+        `updated_at` is rendered again, or without it, by the generations of the object (`cache=True`).
+        A whole page is read with one `get_many`.
+
         Args:
             attr (str): The attribute to render.
             django_filter (str): The Django filter to use.
@@ -476,17 +958,43 @@ class CacheAdminField(SimpleAdminField):
             admin_order_field (Optional[str]): The admin order field to use.
             allow_tags (bool): Whether to allow HTML tags in the rendered field.
             default (Optional[str]): The default value to use.
+            timeout (Optional[int]): The cache time in seconds, None to never expire. Defaults to 60.
+            version (Optional[str]): The attribute versioning the value, like `updated_at`. Defaults to None.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
-        self.filter = django_filter
-        self.load = load
-        self.extra = extra
-        super().__init__(attr, short_description, admin_order_field, allow_tags, default)
+        self.timeout = timeout
+        self.version = version
+        # by the version attribute, or by the generations of the objects
+        super().__init__(
+            attr, django_filter, load, extra, short_description, admin_order_field, allow_tags, default,
+            version or True, lazy,
+        )
+        # on the key, a field renamed by __set_name__ keeps a key by filter
+        self._filter_hash = helper.cache_version(repr((attr, django_filter, load, extra)), force_hash=True)
 
-    def render(self, obj):
-        value = super(CacheAdminField, self).render(obj)
-        filter_method = helper.get_django_filter(self.filter, self.load)
-        args = (self.extra) if self.extra else []
-        return filter_method(value, *args)
+    def get_cache_key_name(self) -> str:
+        return '{}.{}'.format(super(CacheAdminField, self).get_cache_key_name(), self._filter_hash)
+
+    def get_cache_timeout(self) -> Optional[int]:
+        return self.timeout
+
+    def cache_key(self, obj: Model) -> str:
+        """
+        Cache key of the rendered value of an object, like
+        `easy.test_app.poll.PollAdmin.upper_name.<language>.<prefix hash>.<hash>.1.<version>`, with a hash of the
+        attribute, filter, load and extra.
+
+        Args:
+            obj (Model): The model instance.
+
+        Returns:
+            str: The cache key.
+        """
+        return helper.cache_method_key(obj, self.get_cache_key_name(), self.get_cache_versions([obj])[obj.pk])
+
+    def get_related_paths(self) -> List[str]:
+        paths = super(CacheAdminField, self).get_related_paths()
+        return paths + [self.version] if self.version else paths
 
 
 class FormatAdminField(BaseAdminField):
@@ -497,6 +1005,8 @@ class FormatAdminField(BaseAdminField):
         short_description: str,
         admin_order_field: Optional[str] = None,
         allow_tags: bool = False,
+        cache: Optional[Union[bool, str]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         Admin field that formats the value using a string format.
@@ -505,10 +1015,19 @@ class FormatAdminField(BaseAdminField):
             short_description (str): The short description of the field.
             admin_order_field (str, optional): The field to order by when clicked in the admin.
             allow_tags (bool, optional): Whether to allow HTML tags in the rendered field.
+            cache (Optional[Union[bool, str]]): Caches the rendered value by version, see BaseAdminField.
+            lazy (bool): Renders a placeholder, filled after the page loads, see BaseAdminField.
         """
         self.format_string = format_string
-        super().__init__(short_description, admin_order_field, allow_tags)
+        super().__init__(short_description, admin_order_field, allow_tags, cache, lazy)
 
     def render(self, obj):
 
         return self.format_string.format(o=obj)
+
+    def get_related_paths(self) -> List[str]:
+        paths = []
+        for _, field_name, _, _ in Formatter().parse(self.format_string):
+            if field_name and field_name.startswith('o.'):
+                paths.append(field_name[2:].split('[')[0])
+        return paths
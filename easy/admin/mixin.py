@@ -1,10 +1,39 @@
 from __future__ import annotations
 
+import csv
+import html
+import inspect
+import json
+from functools import lru_cache, update_wrapper
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import django
 import django.http
+from django import forms
 from django.contrib import messages
-from django.http import HttpRequest
-from django.http.response import HttpResponseRedirect
-from django.urls import re_path, reverse
+from django.contrib.admin.utils import display_for_value, label_for_field, lookup_field
+from django.contrib.admin.views.main import ChangeList
+from django.core import checks
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, prefetch_related_objects
+from django.http import (
+    Http404, HttpRequest, HttpResponse, HttpResponseBadRequest, HttpResponseNotAllowed, JsonResponse,
+    StreamingHttpResponse,
+)
+from django.http.response import HttpResponseBase, HttpResponseRedirect
+from django.urls import path, re_path, reverse
+from django.utils.html import conditional_escape, strip_tags
+from django.utils.safestring import SafeData
+from django.utils.text import capfirst
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import csrf_protect
+
+from easy import helper, instrumentation
+from easy.helper import iscoroutinefunction
+from .decorators import action
+from .field import BaseAdminField
 
 HttpRequest: django.http.HttpRequest
 
@@ -16,16 +45,151 @@ class MixinEasyViews(object):
 
     def get_urls(self):
         urls = super(MixinEasyViews, self).get_urls()
+        info = self._get_info()
+
+        if django.VERSION >= (5, 0):
+            # coroutine views are served on the event loop
+            async_views = (
+                self.easy_async_admin_view(self.easy_object_view_async),
+                self.easy_async_admin_view(self.easy_list_view_async),
+            )
+        else:
+            async_views = None
+        sync_views = (
+            self.admin_site.admin_view(self.easy_object_view),
+            self.admin_site.admin_view(self.easy_list_view),
+        )
+
+        easy_urls = []
+        for view_name, view in self.get_easy_views().items():
+            object_view, list_view = async_views if async_views and iscoroutinefunction(view) else sync_views
+            name = '%s_%s_easy_%s' % (info + (view_name,))
+            if self._easy_view_takes_pk(view):
+                converter = getattr(view, 'pk_converter', None) or self.get_easy_pk_converter()
+                easy_urls.append(
+                    path('<%s:pk>/easy/%s/' % (converter, view_name), object_view, {'action': view_name}, name=name)
+                )
+            if not self._easy_view_requires_pk(view):
+                easy_urls.append(path('easy/%s/' % view_name, list_view, {'action': view_name}, name=name))
 
-        easy_urls = [
-            re_path(r'^(?P<pk>.+)/easy/(?P<action>.+)/$', self.admin_site.admin_view(self.easy_object_view),
-                name='%s_%s_easy' % self._get_info()),
+        # one pattern for the bulk views, easy_bulk_view dispatches by action
+        easy_urls.append(path('easy/<str:action>/bulk/', self.admin_site.admin_view(self.easy_bulk_view),
+                              name='%s_%s_easy_bulk' % info))
 
-            re_path(r'^easy/(?P<action>.+)/$', self.admin_site.admin_view(self.easy_list_view),
-                name='%s_%s_easy' % self._get_info()),
+        # legacy name, reversed with (pk, action) or (action,), resolved by the patterns of each action;
+        # it catches the unknown actions before the `<path:object_id>/` redirect, the last admin URL
+        fallback_view = self.admin_site.admin_view(self.easy_fallback_view)
+        legacy_urls = [
+            re_path(r'^(?P<pk>.+)/easy/(?P<action>.+)/$', fallback_view, name='%s_%s_easy' % info),
+            re_path(r'^easy/(?P<action>.+)/$', fallback_view, name='%s_%s_easy' % info),
         ]
 
-        return easy_urls + urls
+        return urls[:-1] + easy_urls + legacy_urls + urls[-1:]
+
+    @staticmethod
+    def _easy_view_takes_pk(view: Callable) -> bool:
+        # views with their own pk_converter, or an argument after the request, have an object URL
+        if hasattr(view, 'pk_converter'):
+            return True
+        return any(
+            parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD, parameter.VAR_POSITIONAL)
+            for parameter in list(inspect.signature(view).parameters.values())[1:]
+        )
+
+    @staticmethod
+    def _easy_view_requires_pk(view: Callable) -> bool:
+        # views with their own pk_converter, or a pk without default, have no list URL
+        if hasattr(view, 'pk_converter'):
+            return True
+        parameter = inspect.signature(view).parameters.get('pk')
+        return parameter is not None and parameter.default is parameter.empty
+
+    def get_easy_views(self) -> Dict[str, Callable]:
+        """
+        Easy views of the admin, the `easy_view_<action>` methods, found once per admin.
+
+        Returns:
+            Dict[str, Callable]: The views by action.
+        """
+        views = self.__dict__.get('_easy_views')
+        if views is None:
+            views = self._easy_views = {
+                name[len('easy_view_'):]: getattr(self, name) for name in dir(self)
+                if name.startswith('easy_view_') and callable(getattr(self, name))
+            }
+        return views
+
+    def get_easy_bulk_views(self) -> Dict[str, Callable]:
+        """
+        Batch-aware easy views of the admin, the `easy_bulk_view_<action>` methods, found once per admin.
+
+        Returns:
+            Dict[str, Callable]: The views by action.
+        """
+        views = self.__dict__.get('_easy_bulk_views')
+        if views is None:
+            views = self._easy_bulk_views = {
+                name[len('easy_bulk_view_'):]: getattr(self, name) for name in dir(self)
+                if name.startswith('easy_bulk_view_') and callable(getattr(self, name))
+            }
+        return views
+
+    def get_easy_pk_converter(self) -> str:
+        """
+        Path converter of the pk on the object easy views, from the pk field of the model.
+        A view can set its own with a `pk_converter` attribute.
+
+        Returns:
+            str: `int`, `uuid` or `path`.
+        """
+        field = self.model._meta.pk
+        while field.is_relation:
+            # multi-table inheritance
+            field = field.target_field
+
+        internal_type = field.get_internal_type()
+        if internal_type in ('AutoField', 'BigAutoField', 'SmallAutoField', 'IntegerField', 'BigIntegerField',
+                             'SmallIntegerField', 'PositiveIntegerField', 'PositiveBigIntegerField',
+                             'PositiveSmallIntegerField'):
+            return 'int'
+        if internal_type == 'UUIDField':
+            return 'uuid'
+        return 'path'
+
+    def get_easy_async_actions(self) -> List[str]:
+        """
+        Actions of the easy views declared with `async def easy_view_<action>`.
+
+        Returns:
+            List[str]: The action names.
+        """
+        return [action for action, view in self.get_easy_views().items() if iscoroutinefunction(view)]
+
+    def easy_async_admin_view(self, view: Callable) -> Callable:
+        """
+        Like AdminSite.admin_view, for coroutine views. The user is loaded with `request.auser()`,
+        so the permission check does not need a thread.
+
+        Args:
+            view (Callable): The coroutine view.
+
+        Returns:
+            Callable: The coroutine view, checking permission, never cached and csrf protected.
+        """
+        site = self.admin_site
+
+        async def inner(request, *args, **kwargs):
+            request.user = await request.auser()
+            if not site.has_permission(request):
+                from django.contrib.auth.views import redirect_to_login
+
+                return redirect_to_login(request.get_full_path(), reverse('admin:login', current_app=site.name))
+            return await view(request, *args, **kwargs)
+
+        inner = never_cache(inner)
+        if not getattr(view, 'csrf_exempt', False):
+            inner = csrf_protect(inner)
+        return update_wrapper(inner, view)
 
     def easy_object_view(self, request: "HttpRequest", pk: int, action: str) -> "HttpResponseRedirect":
         """
@@ -39,17 +203,15 @@ class MixinEasyViews(object):
         Returns:
             HttpResponseRedirect: The redirect response.
         """
-        method_name = 'easy_view_%s' % action
-
-        view = getattr(self, method_name, None)
+        view = self.get_easy_views().get(action)
         if view:
+            if iscoroutinefunction(view):
+                # asgiref is installed with Django >= 3.0, the only versions running coroutines
+                from asgiref.sync import async_to_sync
+                return async_to_sync(view)(request, pk)
             return view(request, pk)
 
-        self.message_user(request, 'Easy view %s not found' % method_name, messages.ERROR)
-
-        redirect = reverse('admin:%s_%s_change' % self._get_info(), args=(pk,))
-
-        return HttpResponseRedirect(redirect)
+        return self._easy_view_not_found(request, 'easy_view_%s' % action, pk)
 
     def easy_list_view(self, request: "HttpRequest", action: str) -> "HttpResponseRedirect":
         """
@@ -62,14 +224,492 @@ class MixinEasyViews(object):
         Returns:
             HttpResponseRedirect: The redirect response.
         """
-        method_name = 'easy_view_%s' % action
-
-        view = getattr(self, method_name, None)
+        view = self.get_easy_views().get(action)
         if view:
+            if iscoroutinefunction(view):
+                from asgiref.sync import async_to_sync
+                return async_to_sync(view)(request)
             return view(request)
 
+        return self._easy_view_not_found(request, 'easy_view_%s' % action)
+
+    def easy_fallback_view(self, request: "HttpRequest", action: str, pk: Any = None) -> "HttpResponseRedirect":
+        """
+        Executed when the URL of no action matches: the action does not exist, or it does not take this pk
+        (not matching its path converter, or missing).
+
+        Args:
+            request (HttpRequest): The current request.
+            action (str): The action to perform.
+            pk (Any): The primary key of the object, if any.
+
+        Returns:
+            HttpResponseRedirect: The redirect response, with an error message.
+        """
+        if action in self.get_easy_views():
+            raise Http404('Easy view %s does not take this pk' % action)
+        return self._easy_view_not_found(request, 'easy_view_%s' % action, pk)
+
+    def easy_bulk_view(self, request: "HttpRequest", action: str) -> "HttpResponse":
+        """
+        Executes an easy view on many objects, with their pks posted as a JSON list (or `{"pks": [...]}`)
+        or as `pk` form fields. The objects are loaded with one `in_bulk` on the admin queryset.
+
+        The view is `easy_bulk_view_<action>(request, objects)`, called with the objects by pk, returning the
+        results by pk or a response. Without it, `easy_view_<action>(request, pk)` is called for each object,
+        and its result is the status and content of each response.
+
+        Args:
+            request (HttpRequest): The current request.
+            action (str): The action to perform.
+
+        Returns:
+            HttpResponse: The response of the bulk view, or a JsonResponse with the `results` by pk
+            and the `missing` pks.
+        """
+        bulk_view = self.get_easy_bulk_views().get(action)
+        view = self.get_easy_views().get(action)
+        # views with their own pk_converter do not take pks of the model
+        if bulk_view is None and (view is None or hasattr(view, 'pk_converter') or not self._easy_view_takes_pk(view)):
+            raise Http404('Easy bulk view %s not found' % action)
+
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+
+        pks = self._get_easy_bulk_pks(request)
+        if pks is None:
+            return HttpResponseBadRequest('Expected a JSON list of pks, or pk fields')
+
+        field = self.model._meta.pk
+        valid = []
+        for pk in pks:
+            try:
+                valid.append(field.to_python(pk))
+            except (TypeError, ValidationError):
+                pass
+        objects = self.get_queryset(request).in_bulk(valid)
+
+        if bulk_view:
+            if iscoroutinefunction(bulk_view):
+                from asgiref.sync import async_to_sync
+                results = async_to_sync(bulk_view)(request, objects)
+            else:
+                results = bulk_view(request, objects)
+            if isinstance(results, HttpResponseBase):
+                return results
+        else:
+            results = {}
+            for pk in objects:
+                response = self.easy_object_view(request, pk, action)
+                results[pk] = {'status': response.status_code, 'content': response.content.decode(response.charset)}
+
+        found = {str(pk) for pk in objects}
+        return JsonResponse({
+            'results': {str(pk): value for pk, value in results.items()},
+            'missing': [pk for pk in map(str, pks) if pk not in found],
+        }, encoder=DjangoJSONEncoder)
+
+    def _get_easy_bulk_pks(self, request: "HttpRequest") -> Any:
+        if request.content_type != 'application/json':
+            return request.POST.getlist('pk')
+        try:
+            pks = json.loads(request.body)
+        except ValueError:
+            return None
+        if isinstance(pks, dict):
+            pks = pks.get('pks')
+        return pks if isinstance(pks, list) else None
+
+    async def easy_object_view_async(self, request: "HttpRequest", pk: str, action: str) -> "HttpResponse":
+        """
+        Executes the easy object view of a coroutine action, on the event loop.
+        """
+        view = self.get_easy_views().get(action)
+        if view and iscoroutinefunction(view):
+            return await view(request, pk)
+        return self._easy_view_not_found(request, 'easy_view_%s' % action, pk)
+
+    async def easy_list_view_async(self, request: "HttpRequest", action: str) -> "HttpResponse":
+        """
+        Executes the easy list view of a coroutine action, on the event loop.
+        """
+        view = self.get_easy_views().get(action)
+        if view and iscoroutinefunction(view):
+            return await view(request)
+        return self._easy_view_not_found(request, 'easy_view_%s' % action)
+
+    def _easy_view_not_found(self, request: "HttpRequest", method_name: str, pk: Any = None) -> "HttpResponseRedirect":
+        # no database or cache access, safe on sync and async views
         self.message_user(request, 'Easy view %s not found' % method_name, messages.ERROR)
 
-        redirect = reverse('admin:%s_%s_changelist' % self._get_info())
+        if pk is None:
+            redirect = reverse('admin:%s_%s_changelist' % self._get_info())
+        else:
+            redirect = reverse('admin:%s_%s_change' % self._get_info(), args=(pk,))
 
         return HttpResponseRedirect(redirect)
+
+    def easy_view_job(self, request: "HttpRequest", pk: str) -> "JsonResponse":
+        """
+        State of a background action (see easy.action), for the user who started it.
+
+        Args:
+            request (HttpRequest): The current request.
+            pk (str): The id of the job.
+
+        Returns:
+            JsonResponse: The status, progress (`done` of `total`), result and error of the job.
+        """
+        from easy.jobs import Job
+
+        state = Job(pk).get_state()
+        if state is None or not (request.user.is_superuser or state['user'] == request.user.pk):
+            raise Http404('Job %s not found' % pk)
+        return JsonResponse(dict(state, id=pk), encoder=DjangoJSONEncoder)
+
+    # job ids are hex strings, whatever the pk of the model
+    easy_view_job.pk_converter = 'str'
+
+
+class MixinEasyChangeList(object):
+
+    def get_queryset(self, request: "HttpRequest", *args, **kwargs):
+        # the plan is for the changelist only, not for the change form, deletes or easy views
+        root_queryset = self.root_queryset
+        self.root_queryset = self.model_admin.apply_easy_query_plan(
+            root_queryset, self.model_admin.get_easy_query_plan(request)
+        )
+        try:
+            return super(MixinEasyChangeList, self).get_queryset(request, *args, **kwargs)
+        finally:
+            self.root_queryset = root_queryset
+
+    def get_results(self, request: "HttpRequest") -> None:
+        super(MixinEasyChangeList, self).get_results(request)
+
+        self.model_admin.prepare_easy_page(request, list(self.result_list))
+
+
+class EasyChangeList(MixinEasyChangeList, ChangeList):
+    pass
+
+
+@lru_cache(maxsize=None)
+def easy_changelist(changelist: type) -> type:
+    """
+    The ChangeList class with the query plan and the prepare of the easy fields, built once by class.
+
+    Args:
+        changelist (type): A ChangeList class, like the one of another admin mixin.
+
+    Returns:
+        type: The class itself when it plans already, a subclass with MixinEasyChangeList else.
+    """
+    if issubclass(changelist, MixinEasyChangeList):
+        return changelist
+    if changelist is ChangeList:
+        return EasyChangeList
+    return type('Easy' + changelist.__name__, (MixinEasyChangeList, changelist), {})
+
+
+class MixinEasyFields(object):
+
+    def __init__(self, model, admin_site):
+        super().__init__(model, admin_site)
+        # connects the invalidation signals of cached methods declaring `depends`, and of fields cached by
+        # generations, at startup, not at first render: a save in any process must bump the generation
+        for klass in type(self).__mro__:
+            for value in vars(klass).values():
+                if isinstance(value, BaseAdminField):
+                    if value.cache is True:
+                        value.register_cache(model)
+                elif getattr(value, 'depends', None) is not None and callable(getattr(value, 'register', None)):
+                    value.register(model)
+
+    def get_easy_fields(self, request: "HttpRequest") -> List[BaseAdminField]:
+        """
+        Easy fields declared on list_display.
+
+        Args:
+            request (HttpRequest): The current request.
+
+        Returns:
+            List[BaseAdminField]: The easy fields, in list_display order.
+        """
+        fields = []
+        for item in self.get_list_display(request):
+            field = getattr(self, item, None) if isinstance(item, str) else item
+            if isinstance(field, BaseAdminField):
+                fields.append(field)
+        return fields
+
+    def get_easy_query_plan(
+        self, request: "HttpRequest", fields: Optional[List[BaseAdminField]] = None
+    ) -> Dict[str, Any]:
+        """
+        The select_related and prefetch_related lookups and the annotations planned from the easy fields
+        on list_display.
+
+        Args:
+            request (HttpRequest): The current request.
+            fields (Optional[List[BaseAdminField]]): The fields to plan, by default the easy fields on list_display
+                but the lazy ones, planned by their own request.
+
+        Returns:
+            Dict[str, Any]: The lookups, under `select_related` and `prefetch_related` keys, and the annotations
+                by alias under `annotate` key.
+        """
+        if fields is None:
+            fields = [field for field in self.get_easy_fields(request) if not field.lazy]
+
+        paths = []
+        annotations = {}
+        for field in fields:
+            paths.extend(field.get_related_paths())
+            annotations.update(field.get_annotations())
+
+        plan = helper.plan_related(self.model, paths)
+        plan['annotate'] = annotations
+        return plan
+
+    def prepare_easy_page(self, request: "HttpRequest", objs: List[Model], include_lazy: bool = False) -> None:
+        """
+        Calls prepare of the easy fields and of the decorated methods (like `easy.cache`) on list_display,
+        once with all objects of a page.
+
+        Args:
+            request (HttpRequest): The current request.
+            objs (List[Model]): The objects of the page.
+            include_lazy (bool): Prepares the lazy fields too, rendered with the page, like on exports.
+        """
+        for field in self.get_easy_fields(request):
+            if include_lazy or not field.lazy:
+                instrumentation.call(field.get_cache_name(), field.prepare, objs)
+
+        for item in self.get_list_display(request):
+            if isinstance(item, str):
+                method = getattr(self, item, None)
+                prepare = getattr(method, 'prepare', None)
+                if prepare and not isinstance(method, BaseAdminField):
+                    instrumentation.call(method.__qualname__, prepare, self, objs)
+
+    def get_changelist(self, request: "HttpRequest", **kwargs):
+        return easy_changelist(super().get_changelist(request, **kwargs))
+
+    def apply_easy_query_plan(self, qs, plan: Dict[str, Any]):
+        """
+        Applies a plan of get_easy_query_plan to a queryset, like the one of the changelist.
+
+        Args:
+            qs (QuerySet): The queryset.
+            plan (Dict[str, Any]): The plan.
+
+        Returns:
+            QuerySet: The queryset, with the related lookups and the annotations it does not have yet.
+        """
+        if plan['select_related']:
+            qs = qs.select_related(*plan['select_related'])
+        if plan['prefetch_related']:
+            qs = qs.prefetch_related(*plan['prefetch_related'])
+        annotations = {alias: value for alias, value in plan['annotate'].items() if alias not in qs.query.annotations}
+        if annotations:
+            qs = qs.annotate(**annotations)
+        return qs
+
+    @property
+    def media(self):
+        media = super(MixinEasyFields, self).media
+        names = list(self.list_display) + list(self.readonly_fields)
+        if any(getattr(getattr(self, name, None), 'lazy', False) for name in names if isinstance(name, str)):
+            media += forms.Media(js=['easy/js/lazy.js'])
+        return media
+
+    def get_easy_lazy_fields(self, request: "HttpRequest") -> Dict[str, BaseAdminField]:
+        """
+        Lazy easy fields of the admin, on list_display or readonly_fields.
+
+        Args:
+            request (HttpRequest): The current request.
+
+        Returns:
+            Dict[str, BaseAdminField]: The fields by attribute name.
+        """
+        fields = {}
+        for name in list(self.get_list_display(request)) + list(self.get_readonly_fields(request)):
+            field = getattr(self, name, None) if isinstance(name, str) else None
+            if isinstance(field, BaseAdminField) and field.lazy:
+                fields[name] = field
+        return fields
+
+    def easy_view_lazy(self, request: "HttpRequest") -> "JsonResponse":
+        """
+        Renders lazy easy fields for the objects of a page, with the `field` and `pk` parameters repeated,
+        loading the objects with one query and preparing each field once. Served by MixinEasyViews,
+        on a list URL only.
+
+        Args:
+            request (HttpRequest): The current request.
+
+        Returns:
+            JsonResponse: The rendered values by field name and pk.
+        """
+        if not self.has_view_or_change_permission(request):
+            raise PermissionDenied
+
+        lazy_fields = self.get_easy_lazy_fields(request)
+        fields = {name: lazy_fields[name] for name in request.GET.getlist('field') if name in lazy_fields}
+
+        pks = []
+        for value in request.GET.getlist('pk'):
+            try:
+                pks.append(self.model._meta.pk.to_python(value))
+            except ValidationError:
+                pass
+
+        objs = []
+        if fields and pks:
+            plan = self.get_easy_query_plan(request, list(fields.values()))
+            objs = list(self.apply_easy_query_plan(self.get_queryset(request), plan).filter(pk__in=pks))
+
+        values = {}
+        with helper.request_cache():
+            for name, field in fields.items():
+                instrumentation.call(field.get_cache_name(), field.prepare, objs)
+                empty_value_display = getattr(field, 'empty_value_display', self.get_empty_value_display())
+                values[name] = {}
+                for obj in objs:
+                    # like the cells of the changelist (admin_list.items_for_result), on every Django version
+                    value = display_for_value(field.render_cell(obj), empty_value_display)
+                    values[name][str(obj.pk)] = '&nbsp;' if str(value) == '' else conditional_escape(value)
+        return JsonResponse(values)
+
+    def get_export_columns(self, request: "HttpRequest") -> List[Tuple[Any, str]]:
+        """
+        Columns exported by the export actions, the list_display ones.
+
+        Args:
+            request (HttpRequest): The current request.
+
+        Returns:
+            List[Tuple[Any, str]]: The list_display items and their headers.
+        """
+        return [
+            (name, capfirst(label_for_field(name, self.model, self)))
+            for name in self.get_list_display(request) if name != 'action_checkbox'
+        ]
+
+    def get_export_value(self, obj: Model, name: Any) -> str:
+        """
+        Plain text value of a list_display column of an object.
+
+        Args:
+            obj (Model): The object.
+            name (Any): The list_display item.
+
+        Returns:
+            str: The value, without html tags when it is rendered html (safe, or of a field allowing tags).
+        """
+        attr = getattr(self, name, None) if isinstance(name, str) else name
+        if isinstance(attr, BaseAdminField) and attr.lazy:
+            # the value, not the placeholder of the changelist
+            field, value = None, attr.render_cell(obj)
+        else:
+            field, attr, value = lookup_field(name, obj, self)
+        if getattr(field, 'flatchoices', None):
+            value = dict(field.flatchoices).get(value, value)
+        if value is None:
+            return ''
+        if isinstance(value, SafeData) or getattr(attr, 'allow_tags', False):
+            return html.unescape(strip_tags(str(value)))
+        return str(value)
+
+    def iter_export_rows(self, request: "HttpRequest", queryset, chunk_size: int = 2000) -> Iterator[List[str]]:
+        """
+        Headers and then rows of values of the export columns, reading the queryset by chunks.
+
+        Each chunk is prefetched and prepared like a changelist page, so memory does not grow with the queryset.
+
+        Args:
+            request (HttpRequest): The current request.
+            queryset (QuerySet): The objects to export.
+            chunk_size (int): The objects read, prefetched and prepared at once.
+
+        Returns:
+            Iterator[List[str]]: The headers, and then the values of each object.
+        """
+        columns = self.get_export_columns(request)
+        yield [header for _, header in columns]
+
+        # lazy fields too, their values are exported
+        plan = self.get_easy_query_plan(request, self.get_easy_fields(request))
+        prefetch = plan['prefetch_related']
+        queryset = self.apply_easy_query_plan(queryset, dict(plan, prefetch_related=()))
+        objs = queryset.prefetch_related(None).iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(objs, chunk_size))
+            if not chunk:
+                return
+            if prefetch:
+                prefetch_related_objects(chunk, *prefetch)
+            self.prepare_easy_page(request, chunk, include_lazy=True)
+            for obj in chunk:
+                yield [self.get_export_value(obj, name) for name, _ in columns]
+
+    def export_response(self, rows: Iterator[str], content_type: str, extension: str) -> StreamingHttpResponse:
+        response = StreamingHttpResponse(rows, content_type=content_type)
+        response['Content-Disposition'] = 'attachment; filename="%s.%s"' % (self.model._meta.model_name, extension)
+        return response
+
+    @action('Export selected to CSV')
+    def export_csv(self, request: "HttpRequest", queryset) -> StreamingHttpResponse:
+        """
+        Admin action streaming the list_display columns of the selected objects as CSV.
+        """
+        writer = csv.writer(_Echo())
+        rows = self.iter_export_rows(request, queryset, self.easy_export_chunk_size)
+        return self.export_response((writer.writerow(row) for row in rows), 'text/csv', 'csv')
+
+    @action('Export selected to NDJSON')
+    def export_ndjson(self, request: "HttpRequest", queryset) -> StreamingHttpResponse:
+        """
+        Admin action streaming the list_display columns of the selected objects as one JSON object by line.
+        """
+        rows = self.iter_export_rows(request, queryset, self.easy_export_chunk_size)
+        headers = next(rows)
+        lines = (json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder) + '\n' for row in rows)
+        return self.export_response(lines, 'application/x-ndjson', 'ndjson')
+
+    easy_export_chunk_size = 2000
+
+
+class _Echo(object):
+    # file-like object for csv.writer, writerow returns the line instead of buffering it
+
+    def write(self, value: str) -> str:
+        return value
+
+
+@checks.register(checks.Tags.admin)
+def check_lazy_fields(app_configs=None, **kwargs) -> List[checks.CheckMessage]:
+    """
+    Lazy easy fields are filled by the `lazy` easy view, routed on admins with both MixinEasyFields
+    and MixinEasyViews. On other admins, the placeholder fails to reverse or is never filled.
+    """
+    from django.contrib.admin.sites import all_sites
+
+    errors = []
+    for site in all_sites:
+        for model_admin in site._registry.values():
+            if isinstance(model_admin, MixinEasyFields) and isinstance(model_admin, MixinEasyViews):
+                continue
+            for name in tuple(model_admin.list_display) + tuple(model_admin.readonly_fields):
+                field = getattr(model_admin, name, None) if isinstance(name, str) else name
+                if isinstance(field, BaseAdminField) and field.lazy:
+                    errors.append(checks.Error(
+                        "'%s' is a lazy easy field, but the admin has not both MixinEasyFields and MixinEasyViews."
+                        % (field._name or name),
+                        hint='Add both mixins to the admin, or remove lazy=True.',
+                        obj=type(model_admin),
+                        id='easy.E001',
+                    ))
+    return errors
@@ -1,14 +1,56 @@
 from __future__ import annotations
-from typing import Callable, Union, Any
+import datetime
+import hashlib
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Callable, Union, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+from weakref import WeakKeyDictionary
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:  # asgiref < 3.6
+    import asyncio
+    from asyncio import iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
 
 import django
+from django.core.exceptions import FieldDoesNotExist
+from django.core.signals import request_finished, setting_changed
+from django.dispatch import receiver
+try:
+    from django.utils.autoreload import file_changed
+except ImportError:  # Django < 2.2
+    file_changed = None
+from django.urls import NoReverseMatch, get_resolver, get_script_prefix, get_urlconf, reverse
+from django.utils.http import RFC3986_SUBDELIMS
+from django.utils.translation import get_language
 
-EASY_CACHE_TEMPLATE_METHOD = 'easy.{}.{}.{}'
-EASY_CACHE_TEMPLATE_OBJ = 'easy.{}.{}'
+# easy.<app_label>.<model_name>.<method>.<pk>.<model generation>.<object generation>
+EASY_CACHE_TEMPLATE_METHOD = 'easy.{}.{}.{}.{}.{}'
+# generation of an object, easy.<app_label>.<model_name>.<pk>
+EASY_CACHE_TEMPLATE_OBJ = 'easy.{}.{}.{}'
+# generation of a model, easy.<app_label>.<model_name>
+EASY_CACHE_TEMPLATE_MODEL = 'easy.{}.{}'
 
 
 Model: django.db.models.Model
 
+_memo: ContextVar = ContextVar('easy_memo', default=None)
+# request-local cache (L1), set by easy.middleware.EasyCacheMiddleware or request_cache
+_local_cache: ContextVar = ContextVar('easy_local_cache', default=None)
+
+# url templates by resolver, a new resolver is created when the URLconf changes or clear_url_caches is called
+_url_templates: WeakKeyDictionary = WeakKeyDictionary()
+_URL_PK_PLACEHOLDER = '__easy_pk__'
+
+_CACHE_VERSION_RE = re.compile(r'^[\w.:-]{1,64}$')
+
 class Nothing(object):
     def __str__(self):
         return 'Error'
@@ -17,6 +59,10 @@ class Nothing(object):
         return u'Error'
 
 
+# shared instance, returned for every missing attribute
+NOTHING = Nothing()
+
+
 def deep_getattribute(obj: object, attr: str) -> Union[object, Callable]:
     """
     Retrieves the value of a nested attribute from an object.
@@ -28,15 +74,89 @@ def deep_getattribute(obj: object, attr: str) -> Union[object, Callable]:
     Returns:
         object: The value of the attribute, or a Nothing instance if the attribute does not exist.
     """
-    attrs = attr.split(".")
-    for i in attrs:
-        obj = getattr(obj, i, Nothing())
+    for i in attr.split("."):
+        obj = getattr(obj, i, NOTHING)
     return obj
 
+
+def compile_getter(attr: str) -> Callable[[object], Any]:
+    """
+    Compiles deep_getattribute for an attribute path, so the path is parsed only once.
+
+    Args:
+        attr (str): The attribute to retrieve, in the form of a dot-separated string.
+
+    Returns:
+        Callable[[object], Any]: Function that receives the object and returns the value of the attribute,
+            or NOTHING if the attribute does not exist.
+    """
+    names = tuple(attr.split('.'))
+
+    # unrolled for the usual short paths, getattr with default is cheaper than catching AttributeError
+    if len(names) == 1:
+        name, = names
+
+        def get(obj):
+            return getattr(obj, name, NOTHING)
+    elif len(names) == 2:
+        first, second = names
+
+        def get(obj):
+            return getattr(getattr(obj, first, NOTHING), second, NOTHING)
+    elif len(names) == 3:
+        first, second, third = names
+
+        def get(obj):
+            return getattr(getattr(getattr(obj, first, NOTHING), second, NOTHING), third, NOTHING)
+    else:
+        def get(obj):
+            for name in names:
+                obj = getattr(obj, name, NOTHING)
+            return obj
+
+    return get
+
+
+def compile_accessor(attr: Union[str, Callable[[object], Any]], default: Any = None) -> Callable[[object], Any]:
+    """
+    Compiles call_or_get for an attribute, so the path is parsed and the checks are done only once.
+
+    Args:
+        attr (Union[str, Callable[[object], Any]]): The attribute to call or retrieve.
+        default (Any, optional): The default value to return if the attribute's value is falsy or NOTHING.
+
+    Returns:
+        Callable[[object], Any]: Function that receives the object and returns the same as call_or_get.
+    """
+    if callable(attr):
+        get = attr
+    else:
+        getter = compile_getter(attr)
+
+        def get(obj):
+            value = getter(obj)
+            if callable(value):
+                return value()
+            return value
+
+    if default is None:
+        return get
+
+    def get_or_default(obj):
+        ret = get(obj)
+        if not ret or ret is NOTHING:
+            return default
+        return ret
+
+    return get_or_default
+
+@lru_cache(maxsize=128)
 def get_django_filter(django_filter: str, load: str = 'django') -> Callable:
     """
     Retrieves a Django filter method from the specified templatetag library.
 
+    Filters are resolved once per filter and library, and kept until INSTALLED_APPS or TEMPLATES change.
+
     Args:
         django_filter (str): The name of the Django filter method.
         load (str, optional): The name of the templatetag library to load. Defaults to 'django'.
@@ -49,9 +169,8 @@ def get_django_filter(django_filter: str, load: str = 'django') -> Callable:
     """
     from django.template.backends.django import get_installed_libraries
     from django.template.library import import_library
-    libraries = get_installed_libraries()
     if load and not load == 'django':
-        library_path = libraries.get(load)
+        library_path = get_installed_libraries().get(load)
         if not library_path:
             raise Exception('templatetag "{}" is not registered'.format(load))
     else:
@@ -65,6 +184,40 @@ def get_django_filter(django_filter: str, load: str = 'django') -> Callable:
     return filter_method
 
 
+@lru_cache(maxsize=128)
+def get_template(template_name: str) -> Any:
+    """
+    Retrieves a template, loaded and compiled once per name.
+
+    Templates are kept until INSTALLED_APPS or TEMPLATES change, or the autoreloader sees a template file change.
+
+    Args:
+        template_name (str): The name of the template.
+
+    Returns:
+        Any: The template of the template backend.
+    """
+    from django.template.loader import get_template as django_get_template
+    return django_get_template(template_name)
+
+
+@receiver(setting_changed)
+def clear_django_filters(setting: str, **kwargs) -> None:
+    if setting in ('INSTALLED_APPS', 'TEMPLATES'):
+        get_django_filter.cache_clear()
+        get_template.cache_clear()
+
+
+def clear_templates(file_path, **kwargs) -> None:
+    # like django.template.autoreload, that resets the template loaders on changes of non python files
+    if file_path.suffix != '.py':
+        get_template.cache_clear()
+
+
+if file_changed is not None:
+    file_changed.connect(clear_templates)
+
+
 def call_or_get(obj: object, attr: Union[str, Callable[[object], Any]], default: Any = None) -> Any:
     """
     Calls the given attribute if it is a callable, otherwise retrieves its value.
@@ -77,30 +230,305 @@ def call_or_get(obj: object, attr: Union[str, Callable[[object], Any]], default:
     Returns:
         Any: The result of calling the attribute if it is a callable, otherwise its value. If the attribute's value is None or an instance of Nothing, returns the default value if it is provided, otherwise returns None.
     """
-    ret = Nothing()
-
     if callable(attr):
         ret = attr(obj)
+    else:
+        ret = deep_getattribute(obj, attr)
+        if callable(ret):
+            ret = ret()
 
-    if isinstance(ret, Nothing):
-        value = deep_getattribute(obj, attr)
-        if callable(value):
-            ret = value()
-        else:
-            ret = value
-
-    if (not ret or isinstance(ret, Nothing)) and default is not None:
+    if default is not None and (not ret or ret is NOTHING):
         ret = default
 
     return ret
 
-def cache_method_key(model: Model, method_name: str) -> str:
+def reverse_cached(viewname: str, pk: Any = NOTHING) -> str:
+    """
+    Same as reverse for urls without arguments or with only the pk, like admin change and changelist urls,
+    but the url is reversed only once and the pk is inserted on it.
+
+    Urls are kept by URLconf, script prefix and language, so per-request urlconfs, `SCRIPT_NAME` prefixes,
+    `set_urlconf` and `clear_url_caches` are respected.
+
+    Args:
+        viewname (str): The url name, like `admin:app_model_change`.
+        pk (Any, optional): The pk of the object, when the url has it.
+
+    Returns:
+        str: The url.
+    """
+    resolver = get_resolver(get_urlconf())
+    templates = _url_templates.get(resolver)
+    if templates is None:
+        templates = _url_templates[resolver] = {}
+
+    key = (viewname, pk is NOTHING, get_script_prefix(), get_language())
+    template = templates.get(key)
+    if template is None:
+        if pk is NOTHING:
+            template = (reverse(viewname), '')
+        else:
+            try:
+                template = reverse(viewname, args=(_URL_PK_PLACEHOLDER,)).partition(_URL_PK_PLACEHOLDER)[::2]
+            except NoReverseMatch:
+                # pk converter does not accept the placeholder, like int
+                template = False
+        templates[key] = template
+
+    if pk is NOTHING:
+        return template[0]
+    if template is False:
+        return reverse(viewname, args=(pk,))
+    return template[0] + quote(str(pk), safe=RFC3986_SUBDELIMS + '/~:@') + template[1]
+
+
+def get_relation(model: Model, name: str) -> Optional[django.db.models.Field]:
+    """
+    Retrieves the relation reached by an attribute name of a model.
+
+    Args:
+        model (Model): The model class.
+        name (str): The attribute name, like `poll`, `question_set` or `generic`.
+
+    Returns:
+        Optional[Field]: The relation field, or None if the attribute is not a relation.
+    """
+    opts = model._meta
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        field = next((rel for rel in opts.related_objects if rel.get_accessor_name() == name), None)
+    else:
+        if field.auto_created and not field.concrete and field.get_accessor_name() != name:
+            # reverse relations are found by query name, but are accessed by accessor name
+            return None
+        if name != field.name and name == getattr(field, 'attname', None):
+            # like `poll_id`, value is on the row itself
+            return None
+
+    if field is None or not field.is_relation:
+        return None
+    return field
+
+
+def plan_related(model: Model, paths: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Works out the select_related and prefetch_related lookups needed by dotted attribute paths.
+
+    Forward foreign keys and one to one relations are joined with select_related, reverse and many to many
+    relations (and everything after them) are loaded with prefetch_related. Relations only counted or checked,
+    like `question_set.count` or `question_set.exists`, are not prefetched: loading every related row costs more
+    than one query by object, use an annotation instead, like the `count` of LinkChangeListAdminField.
+
+    Args:
+        model (Model): The model class the paths start from.
+        paths (Iterable[str]): The dotted paths, like `poll.owner.name` or `question_set.count`.
+
+    Returns:
+        Dict[str, Tuple[str, ...]]: The lookups, under `select_related` and `prefetch_related` keys.
+    """
+    from django.contrib.contenttypes.fields import GenericForeignKey
+
+    select_related = set()
+    prefetch_related = set()
+
+    for path in paths:
+        current = model
+        walked = []
+        prefetch = False
+        names = path.split('.')
+        for i, name in enumerate(names):
+            field = get_relation(current, name)
+            if field is None:
+                break
+            if (field.one_to_many or field.many_to_many) and names[i + 1:] in (['count'], ['exists']):
+                # manager methods, run on the database anyway
+                break
+
+            walked.append(name)
+            if isinstance(field, GenericForeignKey):
+                ct_lookup = '__'.join(walked[:-1] + [field.ct_field])
+                (prefetch_related if prefetch else select_related).add(ct_lookup)
+                if len(walked) < len(names):
+                    prefetch_related.add('__'.join(walked))
+                break
+
+            if prefetch or field.one_to_many or field.many_to_many:
+                prefetch = True
+                prefetch_related.add('__'.join(walked))
+            else:
+                select_related.add('__'.join(walked))
+            current = field.related_model
+
+    return {
+        'select_related': tuple(sorted(select_related)),
+        'prefetch_related': tuple(sorted(prefetch_related)),
+    }
+
+
+def prefetch_paths(objs: List[Model], paths: Iterable[str]) -> None:
+    """
+    Loads, for a whole list of objects at once, the relations reached by dotted attribute paths.
+
+    Relations already loaded, like by select_related, are not fetched again.
+
+    Args:
+        objs (List[Model]): The objects, all of the same model.
+        paths (Iterable[str]): The dotted paths, like `poll.owner.name` or `question_set.count`.
+    """
+    from django.db.models import prefetch_related_objects
+
+    if not objs:
+        return
+    plan = plan_related(type(objs[0]), paths)
+    lookups = plan['select_related'] + plan['prefetch_related']
+    if lookups:
+        prefetch_related_objects(objs, *lookups)
+
+
+def memoize_many(owner: object, objs: List[Model], values: Dict[Any, Any]) -> None:
+    """
+    Keeps values computed for a page of objects, until the next page of the same owner on this request,
+    or the end of the request out of a request_cache block.
+
+    Args:
+        owner (object): Who computed the values, like an admin field.
+        objs (List[Model]): The objects of the page.
+        values (Dict[Any, Any]): The values by object pk.
+    """
+    memo = _memo.get()
+    if memo is None:
+        memo = {}
+        _memo.set(memo)
+    memo[owner] = {obj.pk: (obj, values[obj.pk]) for obj in objs if obj.pk in values}
+
+
+def get_memoized(owner: object, obj: Model) -> Any:
     """
-    Generates a cache key for a method of a model instance.
+    Retrieves a value kept by memoize_many for an object.
+
+    Args:
+        owner (object): Who computed the values, like an admin field.
+        obj (Model): The object.
+
+    Returns:
+        Any: The value, or NOTHING if there is no value for this object.
+    """
+    memo = _memo.get()
+    if memo and owner in memo:
+        entry = memo[owner].get(getattr(obj, 'pk', None))
+        # same instance only, a pk seen on another page or request must be rendered again
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+    return NOTHING
+
+
+@receiver(request_finished)
+def clear_memo(**kwargs) -> None:
+    # out of request_cache, the memo is on the context of the worker thread, and would keep the pages alive
+    memo = _memo.get()
+    if memo:
+        memo.clear()
+
+
+@contextmanager
+def request_cache() -> Iterator[Dict[Any, Any]]:
+    """
+    Enables the request-local cache (L1), and a new page memo, until the block ends.
+
+    Values read from, or written to, the Django cache by easy are kept in memory for the block,
+    and read again without a round-trip.
+
+    Returns:
+        Dict[Any, Any]: The request-local cache.
+    """
+    local = {}
+    token = _local_cache.set(local)
+    memo_token = _memo.set({})
+    try:
+        yield local
+    finally:
+        _memo.reset(memo_token)
+        _local_cache.reset(token)
+
+
+def local_get_many(keys: Iterable[Any]) -> Dict[Any, Any]:
+    """
+    Retrieves the values of the request-local cache.
+
+    Args:
+        keys (Iterable[Any]): The keys.
+
+    Returns:
+        Dict[Any, Any]: The values found, by key. Empty outside a request_cache block.
+    """
+    local = _local_cache.get()
+    if not local:
+        return {}
+    return {key: local[key] for key in keys if key in local}
+
+
+def local_set_many(values: Dict[Any, Any]) -> None:
+    """
+    Keeps values on the request-local cache, does nothing outside a request_cache block.
+
+    Args:
+        values (Dict[Any, Any]): The values by key.
+    """
+    local = _local_cache.get()
+    if local is not None:
+        local.update(values)
+
+
+def local_delete(key: Any) -> None:
+    """
+    Removes a value from the request-local cache.
+
+    Args:
+        key (Any): The key.
+    """
+    local = _local_cache.get()
+    if local:
+        local.pop(key, None)
+
+
+def cache_version(value: Any, force_hash: bool = False) -> str:
+    """
+    Turns a value, like an `updated_at` datetime, into a version usable on cache keys.
+
+    Args:
+        value (Any): The value.
+        force_hash (bool): Whether to always hash the value.
+
+    Returns:
+        str: The value, or its hash if it has characters not allowed on cache keys.
+    """
+    if isinstance(value, datetime.datetime):
+        value = value.timestamp()
+    value = str(value)
+    if force_hash or not _CACHE_VERSION_RE.match(value):
+        return hashlib.md5(value.encode()).hexdigest()[:12]
+    return value
+
+
+def cache_locale() -> str:
+    """
+    Active language and script prefix, on the cache keys of rendered html, which has translated text and urls.
+
+    Returns:
+        str: The language and a hash of the script prefix, joined by a dot.
+    """
+    return '{}.{}'.format(cache_version(get_language()), cache_version(get_script_prefix(), force_hash=True))
+
+
+def cache_method_key(model: Model, method_name: str, version: str = 'n.n') -> str:
+    """
+    Generates a cache key for a method of a model instance, like `easy.test_app.poll.PollAdmin.count.1.n.n`.
 
     Args:
         model (Model): The model instance.
         method_name (str): The name of the method.
+        version (str): The generations of the model and of the object, joined by a dot.
 
     Returns:
         str: The cache key.
@@ -109,13 +537,30 @@ def cache_method_key(model: Model, method_name: str) -> str:
         model._meta.app_label,
         model._meta.model_name,
         method_name,
-        model.pk
+        model.pk,
+        version
+    )
+
+
+def cache_model_key(model: Union[Model, type]) -> str:
+    """
+    Generates the cache key of the generation of a model, like `easy.test_app.poll`.
+
+    Args:
+        model (Union[Model, type]): The model class or instance.
+
+    Returns:
+        str: The cache key.
+    """
+    return EASY_CACHE_TEMPLATE_MODEL.format(
+        model._meta.app_label,
+        model._meta.model_name
     )
 
 
 def cache_object_key(model: Model) -> str:
     """
-    Generates a cache key for a model instance.
+    Generates the cache key of the generation of a model instance, like `easy.test_app.poll.1`.
 
     Args:
         model (Model): The model instance.
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger('easy.instrumentation')
+
+# stats of the current request by field or method name, None when not collecting
+_stats: ContextVar[Optional[Dict[str, Dict[str, Any]]]] = ContextVar('easy_instrumentation', default=None)
+# stats of the fields and methods being called, the innermost last
+_current: ContextVar[tuple] = ContextVar('easy_instrumentation_current', default=())
+
+
+def is_active() -> bool:
+    """
+    Returns:
+        bool: If the calls of easy fields and methods are being recorded.
+    """
+    return _stats.get() is not None
+
+
+@contextmanager
+def collect() -> Iterator[Dict[str, Dict[str, Any]]]:
+    """
+    Records the calls of easy fields and of methods decorated by easy (short, smart and cache) in the block.
+
+    Yields:
+        Dict[str, Dict[str, Any]]: The stats by field or method name, with the `calls`, the `time` in seconds,
+        the database `queries`, and the cache `hits` and `misses`. Time and queries of nested calls are
+        counted on both.
+    """
+    token = _stats.set({})
+    current = _current.set(())
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_count_query))
+            yield _stats.get()
+    finally:
+        _current.reset(current)
+        _stats.reset(token)
+
+
+def _count_query(execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+    for entry in _current.get():
+        entry['queries'] += 1
+    return execute(sql, params, many, context)
+
+
+def call(name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """
+    Calls a function, recording it under `name` while collecting.
+
+    Args:
+        name (str): The name of the field or method.
+        func (Callable): The function.
+
+    Returns:
+        Any: The return of the function.
+    """
+    stats = _stats.get()
+    if stats is None:
+        return func(*args, **kwargs)
+
+    entry = stats.get(name)
+    if entry is None:
+        entry = stats[name] = {'calls': 0, 'time': 0.0, 'queries': 0, 'hits': 0, 'misses': 0}
+    token = _current.set(_current.get() + (entry,))
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        entry['time'] += time.perf_counter() - start
+        entry['calls'] += 1
+        _current.reset(token)
+
+
+def count_cache(hits: int, misses: int) -> None:
+    """
+    Counts cache hits and misses on the field or method being called.
+    """
+    current = _current.get()
+    if current:
+        current[-1]['hits'] += hits
+        current[-1]['misses'] += misses
+
+
+def instrument(func: Callable) -> Callable:
+    """
+    Records the calls of a method while collecting, by its qualified name.
+    Out of `collect`, it costs one context variable lookup by call.
+
+    Args:
+        func (Callable): The method.
+
+    Returns:
+        Callable: The method recorded, or itself if it already is.
+    """
+    if getattr(func, '_easy_instrumented', False):
+        return func
+
+    name = func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _stats.get() is None:
+            return func(*args, **kwargs)
+        return call(name, func, *args, **kwargs)
+
+    wrapper._easy_instrumented = True
+    return wrapper
+
+
+@lru_cache(maxsize=None)
+def get_sinks() -> List[Callable]:
+    """
+    Retrieves the sinks of the stats of a request, the `EASY_INSTRUMENTATION_SINKS` setting, dotted paths of
+    callables called with the request, the response and the stats. By default, the stats are logged.
+
+    Returns:
+        List[Callable]: The sinks.
+    """
+    paths = getattr(settings, 'EASY_INSTRUMENTATION_SINKS', ('easy.instrumentation.log_sink',))
+    return [import_string(path) for path in paths]
+
+
+@receiver(setting_changed)
+def clear_sinks(setting: str, **kwargs) -> None:
+    if setting == 'EASY_INSTRUMENTATION_SINKS':
+        get_sinks.cache_clear()
+
+
+def log_sink(request: Any, response: Any, stats: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Logs the stats on the `easy.instrumentation` logger, the slowest first.
+    """
+    for name, entry in sorted(stats.items(), key=lambda item: -item[1]['time']):
+        logger.info(
+            '%s %s %s: %d calls, %.3f ms, %d queries, %d cache hits, %d cache misses',
+            request.method, request.path, name, entry['calls'], entry['time'] * 1000, entry['queries'],
+            entry['hits'], entry['misses'],
+        )
+
+
+def header_sink(request: Any, response: Any, stats: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Adds the stats to the `Server-Timing` header of the response, shown by the browser developer tools.
+    """
+    metrics = [
+        'easy-%d;desc="%s: %d calls, %d queries, %d cache hits, %d cache misses";dur=%.3f' % (
+            i, name, entry['calls'], entry['queries'], entry['hits'], entry['misses'], entry['time'] * 1000,
+        )
+        for i, (name, entry) in enumerate(stats.items(), 1)
+    ]
+    if metrics:
+        if response.has_header('Server-Timing'):
+            metrics.insert(0, response['Server-Timing'])
+        response['Server-Timing'] = ', '.join(metrics)
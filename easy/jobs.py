@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import traceback
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.core.signals import setting_changed
+from django.db import connections, transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# state of a background action, easy.job.<id>
+EASY_CACHE_TEMPLATE_JOB = 'easy.job.{}'
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class ImmediateExecutor(object):
+    """
+    Runs jobs in the current thread, when submitted. Useful on tests and to debug background actions.
+    """
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class ThreadExecutor(ThreadPoolExecutor):
+    """
+    Thread pool closing the database connections of its threads after each job.
+    """
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        return super().submit(_close_connections_after, fn, *args, **kwargs)
+
+
+def _close_connections_after(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        connections.close_all()
+
+
+@lru_cache(maxsize=None)
+def get_executor() -> Any:
+    """
+    Retrieves the executor of background actions, an object with a `submit(fn, *args)` method, like the ones
+    of concurrent.futures.
+
+    It is the `EASY_ACTION_EXECUTOR` setting, the dotted path of an executor class or instance, or a thread pool
+    with `EASY_ACTION_WORKERS` threads (4 by default). Jobs are submitted with strings and pks only, so a
+    ProcessPoolExecutor, or a task queue adapter, can be used too.
+
+    Returns:
+        Any: The executor.
+    """
+    path = getattr(settings, 'EASY_ACTION_EXECUTOR', None)
+    if not path:
+        return ThreadExecutor(getattr(settings, 'EASY_ACTION_WORKERS', 4), thread_name_prefix='easy')
+
+    executor = import_string(path)
+    return executor() if isinstance(executor, type) else executor
+
+
+@receiver(setting_changed)
+def clear_executor(setting: str, **kwargs) -> None:
+    if setting in ('EASY_ACTION_EXECUTOR', 'EASY_ACTION_WORKERS'):
+        get_executor.cache_clear()
+
+
+class Job(object):
+    """
+    A background action, with its state kept on the Django cache for `EASY_JOB_TIMEOUT` seconds (a day by default).
+    """
+
+    def __init__(self, job_id: str) -> None:
+        self.id = job_id
+        self.key = EASY_CACHE_TEMPLATE_JOB.format(job_id)
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            Optional[Dict[str, Any]]: The state of the job, None if it does not exist or expired.
+        """
+        return django_cache.get(self.key)
+
+    def update(self, **values: Any) -> None:
+        state = self.get_state() or {}
+        state.update(values)
+        django_cache.set(self.key, state, getattr(settings, 'EASY_JOB_TIMEOUT', 60 * 60 * 24))
+
+    def progress(self, done: int, total: Optional[int] = None) -> None:
+        """
+        Reports the progress of the job, called by the action.
+
+        Args:
+            done (int): The objects already processed.
+            total (Optional[int]): The objects to process, if not the number of selected objects.
+        """
+        if total is None:
+            self.update(done=done)
+        else:
+            self.update(done=done, total=total)
+
+
+def start_job(model_admin: Any, action_name: str, user_id: Any, pks: List[Any]) -> Job:
+    """
+    Starts an action of an admin in the background, on the selected objects.
+
+    Args:
+        model_admin (ModelAdmin): The admin of the action.
+        action_name (str): The name of the action method on the admin.
+        user_id (Any): The pk of the user who started the action, the only one allowed to see its state.
+        pks (List[Any]): The pks of the selected objects.
+
+    Returns:
+        Job: The job.
+    """
+    job = Job(uuid.uuid4().hex)
+    opts = model_admin.model._meta
+    job.update(status=PENDING, action=action_name, user=user_id, done=0, total=len(pks), result=None, error=None)
+    args = (job.id, model_admin.admin_site.name, opts.app_label, opts.model_name, action_name, pks)
+    # after the commit, the objects and their changes are visible to other connections
+    transaction.on_commit(lambda: get_executor().submit(run_job, *args))
+    return job
+
+
+def iter_objects(model: type, pks: List[Any], chunk_size: int) -> Iterator[Any]:
+    """
+    Loads objects by chunks of pks, so the query parameters and the objects in memory stay bounded
+    whatever the number of selected objects.
+
+    Args:
+        model (type): The model of the objects.
+        pks (List[Any]): The pks, in the order the objects are yielded.
+        chunk_size (int): The number of pks by query.
+
+    Returns:
+        Iterator[Any]: The objects, without the ones deleted since they were selected.
+    """
+    for start in range(0, len(pks), chunk_size):
+        chunk = pks[start:start + chunk_size]
+        objects = model._default_manager.in_bulk(chunk)
+        for pk in chunk:
+            if pk in objects:
+                yield objects[pk]
+
+
+def run_job(job_id: str, site_name: str, app_label: str, model_name: str, action_name: str, pks: List[Any]) -> Any:
+    """
+    Runs a background action, calling it with the admin, the job and an iterator of the selected objects,
+    loaded by chunks of `EASY_JOB_CHUNK_SIZE` (500 by default) pks.
+    The return value of the action is kept as the result of the job.
+    """
+    from django.contrib.admin.sites import all_sites
+
+    job = Job(job_id)
+    job.update(status=RUNNING)
+    try:
+        model = apps.get_model(app_label, model_name)
+        site = next(site for site in all_sites if site.name == site_name)
+        model_admin = site._registry[model]
+        func = getattr(type(model_admin), action_name).background
+
+        result = func(model_admin, job, iter_objects(model, pks, getattr(settings, 'EASY_JOB_CHUNK_SIZE', 500)))
+    except Exception:
+        job.update(status=FAILED, error=traceback.format_exc())
+        raise
+    else:
+        job.update(status=DONE, result=result)
+        return result
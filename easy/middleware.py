@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from easy import helper, instrumentation
+from easy.helper import iscoroutinefunction, markcoroutinefunction
+
+
+class EasyCacheMiddleware(object):
+    """
+    Keeps the values easy reads from the Django cache in memory until the end of the request,
+    so a cached method or field read by list_display, readonly_fields and the change form
+    costs one cache round-trip.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with helper.request_cache():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with helper.request_cache():
+            return await self.get_response(request)
+
+
+class EasyInstrumentationMiddleware(object):
+    """
+    With the `EASY_INSTRUMENTATION` setting, records the calls, time, queries and cache hits and misses of the
+    easy fields and decorated methods of each request, and hands them to the sinks of
+    `EASY_INSTRUMENTATION_SINKS` (see easy.instrumentation). Without it, the middleware is not used.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'EASY_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with instrumentation.collect() as stats:
+            response = self.get_response(request)
+        return self.process_stats(request, response, stats)
+
+    async def __acall__(self, request):
+        with instrumentation.collect() as stats:
+            response = await self.get_response(request)
+        return self.process_stats(request, response, stats)
+
+    def process_stats(self, request, response, stats):
+        for sink in instrumentation.get_sinks():
+            sink(request, response, stats)
+        return response
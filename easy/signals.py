@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import Iterable, List, Set, Tuple
+
+try:
+    from asgiref.local import Local
+except ImportError:  # Django < 3.0, no asgiref and no async
+    from threading import local as Local
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+
+from easy import helper
+from easy.admin.decorators import incr_cache_generation
+
+_registered: Set[Tuple[type, str]] = set()
+_pending = Local()
+
+
+def register(model: type, depends: Iterable[str] = ()) -> None:
+    """
+    Connects receivers that clear the easy cache of objects of a model when they change, or when related objects
+    reached by the `depends` paths change.
+
+    Affected objects are found before (`pre_save`, `pre_delete`, `pre_clear`) and after the change, and their
+    generations are incremented once, when the transaction is committed.
+
+    :param model: The model class of the cached objects.
+    :param depends: Paths of related objects, like `poll`, `poll.owner` or `question_set`.
+    """
+    if (model, '') not in _registered:
+        _registered.add((model, ''))
+        post_save.connect(_self_changed, sender=model, weak=False, dispatch_uid=_uid(model, ''))
+        post_delete.connect(_self_changed, sender=model, weak=False, dispatch_uid=_uid(model, ''))
+
+    for path in depends:
+        if (model, path) in _registered:
+            continue
+        _registered.add((model, path))
+
+        lookups = []
+        source = model
+        for name in path.split('.'):
+            field = helper.get_relation(source, name)
+            if field is None or field.related_model is None:
+                raise ValueError('"{}" is not a relation path of {}'.format(path, model.__name__))
+            lookup = field.name
+            target = field.related_model
+
+            if field.many_to_many:
+                through = field.remote_field.through if field.concrete else field.through
+                _connect_m2m(model, '__'.join(lookups), source, target, lookup, through, path)
+
+            lookups.append(lookup)
+            _connect_related(model, '__'.join(lookups), target, path)
+            source = target
+
+
+def _uid(model: type, path: str, *extra: str) -> str:
+    return 'easy.{}.{}.{}'.format(model._meta.label_lower, path, '.'.join(extra))
+
+
+def _connect_related(model: type, lookup: str, related: type, path: str) -> None:
+    def collect(sender, instance, **kwargs):
+        if not instance._state.adding and instance.pk is not None:
+            pks = _affected(model, lookup, [instance.pk], instance._state.db)
+            instance.__dict__.setdefault('_easy_cache_pks', {})[(model, lookup)] = pks
+
+    def changed(sender, instance, **kwargs):
+        pks = instance.__dict__.get('_easy_cache_pks', {}).pop((model, lookup), [])
+        if kwargs.get('signal') is post_save:
+            pks = set(pks) | set(_affected(model, lookup, [instance.pk], instance._state.db))
+        _invalidate(model, pks, instance._state.db)
+
+    uid = _uid(model, path, lookup)
+    pre_save.connect(collect, sender=related, weak=False, dispatch_uid=uid)
+    pre_delete.connect(collect, sender=related, weak=False, dispatch_uid=uid)
+    post_save.connect(changed, sender=related, weak=False, dispatch_uid=uid)
+    post_delete.connect(changed, sender=related, weak=False, dispatch_uid=uid)
+
+
+def _connect_m2m(model: type, lookup: str, source: type, target: type, name: str, through: type, path: str) -> None:
+    def changed(sender, instance, action, pk_set, using, **kwargs):
+        if action not in ('pre_clear', 'post_add', 'post_remove', 'post_clear'):
+            return
+
+        sources = []
+        if isinstance(instance, source) and kwargs['model'] is target:
+            sources.append(instance.pk)
+        if isinstance(instance, target) and kwargs['model'] is source:
+            if action == 'pre_clear':
+                pk_set = source._base_manager.using(using).filter(**{name: instance.pk}).values_list('pk', flat=True)
+            sources.extend(pk_set or [])
+
+        if action == 'pre_clear':
+            instance.__dict__['_easy_cache_m2m'] = sources
+            return
+        if action == 'post_clear':
+            sources.extend(instance.__dict__.pop('_easy_cache_m2m', []))
+
+        _invalidate(model, _affected(model, lookup, sources, using), using)
+
+    m2m_changed.connect(changed, sender=through, weak=False, dispatch_uid=_uid(model, path, name, 'm2m'))
+
+
+def _self_changed(sender, instance, **kwargs) -> None:
+    _invalidate(sender, [instance.pk], instance._state.db)
+
+
+def _affected(model: type, lookup: str, pks: Iterable, using: str) -> List:
+    pks = list(pks)
+    if not lookup or not pks:
+        return pks
+    return list(
+        model._base_manager.using(using).filter(**{lookup + '__in': pks}).values_list('pk', flat=True).distinct()
+    )
+
+
+def _invalidate(model: type, pks: Iterable, using: str) -> None:
+    keys = {helper.cache_object_key(model(pk=pk)) for pk in pks}
+    if not keys:
+        return
+
+    if not transaction.get_connection(using).in_atomic_block:
+        for key in keys:
+            incr_cache_generation(key)
+        return
+
+    batch = getattr(_pending, using, None)
+    connection = transaction.get_connection(using)
+    # a batch is dropped with its callback when the transaction, or the savepoint it was scheduled in, rolls back
+    if batch is None or not any(entry[1] is batch[1] for entry in connection.run_on_commit):
+        keys_batch = set()
+        batch = (keys_batch, partial(_flush, using, keys_batch))
+        setattr(_pending, using, batch)
+        transaction.on_commit(batch[1], using)
+    batch[0].update(keys)
+
+
+def _flush(using: str, keys: Set[str]) -> None:
+    batch = getattr(_pending, using, None)
+    if batch is not None and batch[0] is keys:
+        setattr(_pending, using, None)
+    for key in keys:
+        incr_cache_generation(key)
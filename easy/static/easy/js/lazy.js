@@ -0,0 +1,58 @@
+/*
+ * Fills the placeholders of lazy easy fields, with one request by easy view for all of them.
+ */
+(function () {
+    'use strict';
+
+    function load() {
+        var requests = {};
+
+        document.querySelectorAll('.easy-lazy[data-easy-url]').forEach(function (cell) {
+            var url = cell.getAttribute('data-easy-url');
+            var request = requests[url] = requests[url] || {fields: {}, pks: {}, cells: []};
+            request.fields[cell.getAttribute('data-easy-field')] = true;
+            request.pks[cell.getAttribute('data-easy-pk')] = true;
+            request.cells.push(cell);
+        });
+
+        Object.keys(requests).forEach(function (url) {
+            var request = requests[url];
+            var query = new URLSearchParams();
+            Object.keys(request.fields).forEach(function (field) {
+                query.append('field', field);
+            });
+            Object.keys(request.pks).forEach(function (pk) {
+                query.append('pk', pk);
+            });
+
+            fetch(url + '?' + query.toString(), {
+                credentials: 'same-origin',
+                headers: {'Accept': 'application/json', 'X-Requested-With': 'XMLHttpRequest'}
+            }).then(function (response) {
+                if (!response.ok) {
+                    throw new Error(response.statusText);
+                }
+                return response.json();
+            }).then(function (values) {
+                request.cells.forEach(function (cell) {
+                    var value = (values[cell.getAttribute('data-easy-field')] || {})[cell.getAttribute('data-easy-pk')];
+                    if (value !== undefined) {
+                        // rendered and escaped by the server, like the other cells
+                        cell.innerHTML = value;
+                        cell.classList.remove('easy-lazy');
+                    }
+                });
+            }).catch(function () {
+                request.cells.forEach(function (cell) {
+                    cell.classList.add('easy-lazy-error');
+                });
+            });
+        });
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', load);
+    } else {
+        load();
+    }
+})();
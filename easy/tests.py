@@ -1,22 +1,81 @@
+import json
+import os
+import pickle
+import tempfile
+import time
+import unittest
 import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import mock
+
 import django
 
-from django.contrib.admin import AdminSite
-from django.contrib.auth.models import User
+from django.conf import settings
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.contrib.admin import site as admin_site
+from django.contrib.admin.utils import display_for_value
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.models import Group, User
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.messages import get_messages
 from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.core.signals import request_finished
+from django.db import DEFAULT_DB_ALIAS, connection, connections
 from django.http.request import HttpRequest, QueryDict
 from django import test
+from django.template import library, loader
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, get_script_prefix, resolve, reverse, set_script_prefix
+from django.utils import translation
 from django.utils.http import urlencode
 from django.utils.safestring import SafeData
 from model_bakery import baker
+from PIL import Image
 
 import easy
+from easy import helper, instrumentation, jobs, signals
+from easy.admin import decorators
+from easy.admin.mixin import EasyChangeList, MixinEasyChangeList, check_lazy_fields
 from easy.helper import Nothing
-from test_app.admin import PollAdmin
+from easy.middleware import EasyCacheMiddleware
+from easy.thumbnails import thumbnail_stamp
+from test_app.admin import PollAdmin, QuestionAdmin
 from test_app.models import Question, Poll, Tag
 
-from django.utils.timezone import datetime
+from django.utils.timezone import datetime, make_aware
+
+try:
+    from asgiref.sync import async_to_sync
+except ImportError:  # Django < 3.0, without asgiref
+    async_to_sync = None
+
+
+class OnCommitTestCase(test.TestCase):
+
+    if not hasattr(test.TestCase, 'captureOnCommitCallbacks'):
+        # Django < 3.2, like its TestCase.captureOnCommitCallbacks
+        @classmethod
+        @contextmanager
+        def captureOnCommitCallbacks(cls, *, using=DEFAULT_DB_ALIAS, execute=False):
+            callbacks = []
+            start_count = len(connections[using].run_on_commit)
+            try:
+                yield callbacks
+            finally:
+                while True:
+                    callback_count = len(connections[using].run_on_commit)
+                    for _, callback in connections[using].run_on_commit[start_count:]:
+                        callbacks.append(callback)
+                        if execute:
+                            callback()
+                    if callback_count == len(connections[using].run_on_commit):
+                        break
+                    start_count = callback_count
+
 
 class TestSimpleAdminField(test.TestCase):
 
@@ -143,11 +202,23 @@ class TestGenericForeignKeyAdminField(test.TestCase):
             content_type_id = ct.pk
         )
 
+        ContentType.objects.clear_cache()
         with self.assertNumQueries(1):
             custom_field = easy.GenericForeignKeyAdminField('generic', cache_content_type=True)
             for tag in tags:
                 ret = custom_field.render(tag)
 
+    def test_generic_field_request_cache(self):
+        user = baker.make(User)
+        tags = baker.make(Tag, _quantity=5, generic=user)
+        tags = list(Tag.objects.filter(pk__in=[tag.pk for tag in tags]))
+
+        custom_field = easy.GenericForeignKeyAdminField('generic', cache_content_type=True, related_attr='username')
+        ContentType.objects.get_for_id(tags[0].content_type_id)
+        with helper.request_cache(), self.assertNumQueries(1):
+            for tag in tags:
+                self.assertIn(user.username, custom_field.render(tag))
+
     def test_generic_field_with_related_attr(self):
         ct = ContentType.objects.get_for_model(User)
 
@@ -198,6 +269,38 @@ class TestTemplateAdminField(test.TestCase):
         self.assertEqual(expected, ret)
         self.assertTrue(custom_field.allow_tags)
 
+    def test_template_resolved_once(self):
+        questions = baker.make(Question, _quantity=3, question_text='Eba!')
+        custom_field = easy.TemplateAdminField('test.html', {'a': '1'})
+        helper.get_template.cache_clear()
+
+        with mock.patch.object(loader, 'get_template', wraps=loader.get_template) as get_template:
+            self.assertEqual(
+                custom_field.render_many(questions), {question.pk: '<div>Eba! - 1</div>' for question in questions}
+            )
+            custom_field(questions[0])
+            self.assertEqual(get_template.call_count, 1)
+
+    @unittest.skipIf(helper.file_changed is None, 'file_changed needs Django 2.2')
+    def test_template_changed(self):
+        question = baker.make(Question, question_text='Eba!')
+        custom_field = easy.TemplateAdminField('test.html', {'a': '1'})
+        custom_field(question)
+
+        with mock.patch.object(loader, 'get_template', wraps=loader.get_template) as get_template:
+            helper.file_changed.send(sender=None, file_path=Path('test_app/templates/test.html'))
+            custom_field(question)
+            self.assertEqual(get_template.call_count, 1)
+
+    def test_template_escape_by_row(self):
+        questions = [baker.make(Question, question_text='<b>'), baker.make(Question, question_text='Eba!')]
+        custom_field = easy.TemplateAdminField('test.html')
+
+        self.assertEqual(
+            custom_field.render_many(questions),
+            {questions[0].pk: '<div>&lt;b&gt; - </div>', questions[1].pk: '<div>Eba! - </div>'}
+        )
+
 
 class TestLinkChangeListAdminField(test.TestCase):
 
@@ -218,6 +321,43 @@ class TestLinkChangeListAdminField(test.TestCase):
         self.assertTrue(custom_field.allow_tags)
 
 
+    def test_link_count(self):
+        poll = baker.make(Poll)
+        baker.make(Question, _quantity=3, poll=poll)
+        custom_field = easy.LinkChangeListAdminField('test_app', 'question', 'question_set.count', {'poll': 'id'},
+                                                     count='question')
+        poll = Poll.objects.annotate(**custom_field.get_annotations()).get()
+
+        with self.assertNumQueries(0):
+            ret = custom_field(poll)
+
+        self.assertEqual(u'<a href="/admin/test_app/question/?poll=%s">3</a>' % poll.pk, ret)
+        self.assertEqual(custom_field.admin_order_field, 'easy_count_question')
+
+    def test_link_count_without_annotation(self):
+        poll = baker.make(Poll)
+        baker.make(Question, _quantity=2, poll=poll)
+        custom_field = easy.LinkChangeListAdminField('test_app', 'question', 'question_set.count', {'poll': 'id'},
+                                                     count='question')
+
+        self.assertIn('>2</a>', custom_field(poll))
+
+    def test_link_count_admin(self):
+        admin = PollAdmin(Poll, AdminSite())
+        for quantity in (2, 0, 1):
+            poll = baker.make(Poll)
+            for _ in range(quantity):
+                baker.make(Question, poll=poll)
+
+        plan = admin.get_easy_query_plan(HttpRequest())
+        polls = admin.apply_easy_query_plan(admin.get_queryset(HttpRequest()), plan).order_by('-easy_count_question')
+
+        self.assertEqual(list(plan['annotate']), ['easy_count_question'])
+        self.assertEqual(plan['prefetch_related'], ())
+        with self.assertNumQueries(1):
+            self.assertEqual([admin.count_question(poll)[-5:] for poll in polls], ['2</a>', '1</a>', '0</a>'])
+
+
 class TestImageField(test.TestCase):
 
     def test_image_field(self):
@@ -230,11 +370,70 @@ class TestImageField(test.TestCase):
         custom_field = easy.ImageAdminField('image', {'title': 'question_text'})
         ret = custom_field(question)
 
-        expected = u'<img src="asd.jpg" title="bla"/>'
+        # the url of the file, on MEDIA_URL, '/asd.jpg' or 'asd.jpg' for '' depending on the Django version
+        expected = u'<img src="%s" title="bla"/>' % question.image.url
 
         self.assertEqual(expected, ret)
         self.assertTrue(custom_field.allow_tags)
 
+    @test.override_settings(MEDIA_URL='/media/')
+    def test_media_url(self):
+        question = baker.make(Question, image='asd.jpg')
+
+        self.assertEqual(easy.ImageAdminField('image')(question), '<img src="/media/asd.jpg"/>')
+        self.assertEqual(easy.ImageAdminField('image')(baker.make(Question)), '<img src=""/>')
+
+    def test_thumbnail(self):
+        cache.clear()
+        with tempfile.TemporaryDirectory() as media_root, \
+                test.override_settings(MEDIA_ROOT=media_root, MEDIA_URL='/media/'):
+            Image.new('RGB', (400, 200)).save(os.path.join(media_root, 'photo.png'))
+            Image.new('RGB', (80, 60)).save(os.path.join(media_root, 'small.png'))
+            questions = [baker.make(Question, image='photo.png'), baker.make(Question, image='small.png')]
+            photo, small = thumbnail_stamp(questions[0].image), thumbnail_stamp(questions[1].image)
+
+            custom_field = easy.ImageAdminField('image', {'title': 'question_text'}, thumbnail=(100, 100))
+            values = custom_field.render_many(questions)
+
+            self.assertEqual(values[questions[0].pk], (
+                '<img height="50" loading="lazy" src="/media/thumbnails/photo.100x100.{0}.png" '
+                'srcset="/media/thumbnails/photo.100x100.{0}.png 1x, /media/thumbnails/photo.200x200.{0}.png 2x" '
+                'title="{1}" width="100"/>'.format(photo, questions[0].question_text)
+            ))
+            # not enlarged, so without a 2x
+            self.assertIn('src="/media/thumbnails/small.100x100.%s.png" ' % small, values[questions[1].pk])
+            self.assertIn('width="80"', values[questions[1].pk])
+            self.assertNotIn('srcset', values[questions[1].pk])
+            with default_storage.open('thumbnails/photo.200x200.%s.png' % photo) as thumbnail:
+                self.assertEqual(Image.open(thumbnail).size, (200, 100))
+
+            # the urls are on the cache
+            with mock.patch('easy.admin.field.get_thumbnail') as get_thumbnail:
+                self.assertEqual(custom_field(Question.objects.get(pk=questions[0].pk)), values[questions[0].pk])
+            get_thumbnail.assert_not_called()
+
+            # an image replaced under the same name gets new thumbnails
+            Image.new('RGB', (200, 400)).save(os.path.join(media_root, 'photo.png'))
+            os.utime(os.path.join(media_root, 'photo.png'), (1, 1))
+            value = custom_field(Question.objects.get(pk=questions[0].pk))
+
+            self.assertIn('src="/media/thumbnails/photo.100x100.1.png" ', value)
+            self.assertIn('width="50"', value)
+
+    def test_thumbnail_not_saved(self):
+        cache.clear()
+        with tempfile.TemporaryDirectory() as media_root, \
+                test.override_settings(MEDIA_ROOT=media_root, MEDIA_URL='/media/'):
+            Image.new('RGB', (400, 200)).save(os.path.join(media_root, 'photo.png'))
+            question = baker.make(Question, image='photo.png')
+
+            # like a read-only storage
+            with mock.patch.object(FileSystemStorage, 'save', side_effect=PermissionError):
+                value = easy.ImageAdminField('image', thumbnail=(100, 100))(question)
+
+            self.assertEqual(value, '<img loading="lazy" src="/media/photo.png"/>')
+
+
 class TestFilterField(test.TestCase):
 
     def test_image_field(self):
@@ -249,6 +448,201 @@ class TestFilterField(test.TestCase):
         self.assertEqual(ret, 'DJANGO ADMIN EASY IS HELPFUL?')
 
 
+    def test_filter_resolved_once(self):
+        questions = baker.make(Question, _quantity=3)
+        custom_field = easy.FilterAdminField('question_text', 'upper')
+        helper.get_django_filter.cache_clear()
+
+        with mock.patch.object(library, 'import_library', wraps=library.import_library) as import_library:
+            for question in questions:
+                custom_field(question)
+
+        self.assertEqual(import_library.call_count, 1)
+
+    def test_filter_cache_cleared_on_setting_changed(self):
+        helper.get_django_filter('upper')
+
+        with test.override_settings(TEMPLATES=[]):
+            self.assertEqual(helper.get_django_filter.cache_info().currsize, 0)
+
+
+class TestCacheField(test.TestCase):
+
+    def setUp(self):
+        # pks are reused between tests
+        cache.clear()
+
+    def test_cached(self):
+        poll = baker.make(Poll, name='eba')
+        custom_field = easy.CacheAdminField('name', 'upper')
+
+        with mock.patch.object(helper, 'get_django_filter', wraps=helper.get_django_filter) as get_filter:
+            self.assertEqual(custom_field(poll), 'EBA')
+            poll.name = 'changed'
+            self.assertEqual(custom_field(poll), 'EBA')
+            self.assertEqual(get_filter.call_count, 1)
+
+    def test_version(self):
+        poll = baker.make(Poll, name='eba')
+        custom_field = easy.CacheAdminField('name', 'upper', version='name')
+
+        self.assertEqual(custom_field(poll), 'EBA')
+        poll.name = 'changed'
+        self.assertEqual(custom_field(poll), 'CHANGED')
+        self.assertEqual(
+            custom_field.cache_key(poll),
+            'easy.test_app.poll.%s.%s.%s.%s.changed' % (
+                custom_field.get_cache_name(), helper.cache_locale(), custom_field._filter_hash, poll.pk
+            )
+        )
+
+    def test_language(self):
+        question = baker.make(Question, pub_date=make_aware(datetime(2016, 10, 15, 12)))
+        custom_field = easy.CacheAdminField('pub_date', 'date', extra=['F'])
+
+        with translation.override('en'):
+            self.assertEqual(custom_field(question), 'October')
+        with translation.override('pt-br'):
+            self.assertEqual(custom_field(question), 'Outubro')
+
+    def test_key_by_filter(self):
+        poll = baker.make(Poll, name='eba')
+
+        def field(django_filter):
+            # same admin and attribute names, another filter
+            class CachedAdmin(ModelAdmin):
+                name = easy.CacheAdminField('name', django_filter)
+            return CachedAdmin.name
+
+        upper, lower = field('upper'), field('lower')
+        self.assertEqual(upper.get_cache_name(), lower.get_cache_name())
+        self.assertNotEqual(upper.cache_key(poll), lower.cache_key(poll))
+        self.assertEqual(upper(poll), 'EBA')
+        self.assertEqual(lower(poll), 'eba')
+
+    def test_render_many(self):
+        polls = baker.make(Poll, _quantity=3, name='eba')
+        custom_field = easy.CacheAdminField('name', 'upper', extra=None, timeout=10, version='name')
+        custom_field(polls[0])
+
+        with mock.patch.object(decorators, 'django_cache', wraps=decorators.django_cache) as cache:
+            self.assertEqual(custom_field.render_cached(polls), {poll.pk: 'EBA' for poll in polls})
+            self.assertEqual((cache.get_many.call_count, cache.set_many.call_count), (1, 1))
+            self.assertEqual(cache.set_many.call_args[0], ({
+                custom_field.cache_key(poll): ('EBA',) for poll in polls[1:]
+            }, 10))
+        self.assertEqual(custom_field.cache_stats, {'hits': 1, 'misses': 3})
+
+    def test_request_cache(self):
+        poll = baker.make(Poll, name='eba')
+        custom_field = easy.CacheAdminField('name', 'upper')
+
+        with helper.request_cache(), \
+                mock.patch.object(decorators, 'django_cache', wraps=decorators.django_cache) as cache:
+            custom_field(poll)
+            calls = cache.get_many.call_count
+            custom_field(poll)
+            self.assertEqual(cache.get_many.call_count, calls)
+
+    def test_middleware(self):
+        def get_response(request):
+            self.assertEqual(helper._local_cache.get(), {})
+            return 'response'
+
+        self.assertEqual(EasyCacheMiddleware(get_response)(HttpRequest()), 'response')
+        self.assertIsNone(helper._local_cache.get())
+
+
+class TestFieldCache(OnCommitTestCase):
+
+    def setUp(self):
+        # pks are reused between tests
+        cache.clear()
+
+    def test_version_attribute(self):
+        poll = baker.make(Poll, name='eba')
+        custom_field = easy.FormatAdminField('{o.name}!', 'Name', cache='name')
+
+        self.assertEqual(custom_field(poll), 'eba!')
+        self.assertEqual(custom_field(poll), 'eba!')
+        poll.name = 'changed'
+        self.assertEqual(custom_field(poll), 'changed!')
+        self.assertEqual(custom_field.cache_stats, {'hits': 1, 'misses': 2})
+
+    def test_generations(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            poll = baker.make(Poll, name='eba')
+        custom_field = easy.SimpleAdminField('name', cache=True)
+
+        self.assertEqual(custom_field(poll), 'eba')
+        Poll.objects.filter(pk=poll.pk).update(name='changed')
+        self.assertEqual(custom_field(Poll.objects.get(pk=poll.pk)), 'eba')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Poll.objects.get(pk=poll.pk).save()
+        self.assertEqual(custom_field(Poll.objects.get(pk=poll.pk)), 'changed')
+
+    def test_locale(self):
+        question = baker.make(Question, pub_date=make_aware(datetime(2016, 10, 15, 12)))
+        link = easy.ForeignKeyAdminField('poll', cache=True)
+        month = easy.FilterAdminField('pub_date', 'date', extra=['F'], cache=True)
+
+        try:
+            set_script_prefix('/tenant-a/')
+            self.assertIn('href="/tenant-a/admin/', link(question))
+            set_script_prefix('/tenant-b/')
+            self.assertIn('href="/tenant-b/admin/', link(question))
+        finally:
+            set_script_prefix('/')
+
+        with translation.override('en'):
+            self.assertEqual(month(question), 'October')
+        with translation.override('pt-br'):
+            self.assertEqual(month(question), 'Outubro')
+
+    def test_registered_at_startup(self):
+        class CachedAdmin(easy.MixinEasyFields, ModelAdmin):
+            name = easy.SimpleAdminField('name', cache=True)
+
+        with mock.patch.object(signals, 'register') as register:
+            CachedAdmin(Poll, AdminSite())
+        register.assert_called_once_with(Poll)
+        self.assertEqual(CachedAdmin.name._cache_registered, {Poll})
+
+    def test_timeout(self):
+        poll = baker.make(Poll)
+        custom_field = easy.SimpleAdminField('name', cache=True)
+
+        with mock.patch.object(decorators, 'django_cache', wraps=decorators.django_cache) as cache:
+            custom_field(poll)
+            with test.override_settings(EASY_CACHE_TIMEOUT=60):
+                custom_field(baker.make(Poll))
+        self.assertEqual([call[0][1] for call in cache.set_many.call_args_list], [None, 60])
+
+    def test_prepare(self):
+        questions = baker.make(Question, _quantity=3)
+        custom_field = easy.ForeignKeyAdminField('poll', 'poll.name', cache='poll_id')
+        custom_field.prepare(questions)
+
+        questions = list(Question.objects.all())
+        with self.assertNumQueries(0):
+            custom_field.prepare(questions)
+            values = [custom_field(question) for question in questions]
+
+        self.assertEqual(custom_field.cache_stats, {'hits': 3, 'misses': 3})
+        self.assertIn(questions[0].poll.name, values[0])
+
+    def test_cache_name(self):
+        class Admin(object):
+            name = easy.SimpleAdminField('name', cache=True)
+
+        inline = easy.SimpleAdminField('name', cache=True)
+
+        self.assertEqual(Admin.name.get_cache_name(), 'Admin.name')
+        self.assertEqual(inline.get_cache_name(), easy.SimpleAdminField('name', cache=True).get_cache_name())
+        self.assertNotEqual(inline.get_cache_name(), easy.SimpleAdminField('name', 'Name', cache=True).get_cache_name())
+
+
 class TestFormatField(test.TestCase):
     def test_format_field(self):
         question = baker.make(
@@ -272,6 +666,66 @@ class TestNothing(test.TestCase):
         self.assertEqual(nothing.__unicode__(), u'Error')
 
 
+class TestAccessor(test.TestCase):
+
+    def test_same_as_call_or_get(self):
+        question = baker.make(Question, question_text='Eba!')
+
+        for attr in ('question_text', 'poll', 'poll.id', 'poll.name.upper', 'not', 'poll.not', 'poll.not.not',
+                     'poll.question_set.count', lambda obj: obj.id):
+            for default in (None, 'default'):
+                self.assertEqual(
+                    helper.compile_accessor(attr, default)(question),
+                    helper.call_or_get(question, attr, default)
+                )
+
+    def test_missing(self):
+        get = helper.compile_getter('poll.not.not.not')
+
+        self.assertIs(get(baker.make(Question)), helper.NOTHING)
+        self.assertIs(helper.deep_getattribute(object(), 'not.not'), helper.NOTHING)
+
+
+class TestReverseCached(test.TestCase):
+
+    def test_same_as_reverse(self):
+        for pk in (1, 'abc', 'a/b c%d', 'ação'):
+            self.assertEqual(
+                helper.reverse_cached('admin:test_app_poll_change', pk),
+                reverse('admin:test_app_poll_change', args=(pk,))
+            )
+        self.assertEqual(
+            helper.reverse_cached('admin:test_app_poll_changelist'),
+            reverse('admin:test_app_poll_changelist')
+        )
+
+    def test_reversed_once(self):
+        questions = baker.make(Question, _quantity=3)
+        custom_field = easy.ForeignKeyAdminField('poll')
+        clear_url_caches()
+
+        with mock.patch.object(helper, 'reverse', wraps=helper.reverse) as reverse:
+            for question in questions:
+                custom_field(question)
+            self.assertEqual(reverse.call_count, 1)
+
+            clear_url_caches()
+            custom_field(questions[0])
+            self.assertEqual(reverse.call_count, 2)
+
+    def test_script_prefix(self):
+        question = baker.make(Question)
+        custom_field = easy.RawIdAdminField('poll')
+        prefix = get_script_prefix()
+
+        set_script_prefix('/prefix/')
+        try:
+            self.assertIn('href="/prefix/admin/test_app/poll/', custom_field(question))
+        finally:
+            set_script_prefix(prefix)
+        self.assertIn('href="/admin/test_app/poll/', custom_field(question))
+
+
 class TestSmartDecorator(test.TestCase):
 
     def test_decorator(self):
@@ -419,6 +873,214 @@ class TestCacheDecorator(test.TestCase):
 
         self.assertNotEqual(value1, value2)
 
+    def test_falsy_values(self):
+        calls = []
+
+        @easy.cache(10)
+        def field(admin, obj):
+            calls.append(obj)
+            return None if len(calls) == 1 else 0
+
+        self.assertIsNone(field(self, self.pool))
+        self.assertIsNone(field(self, self.pool))
+
+        polls = baker.make(Poll, _quantity=2)
+        field.prepare(self, polls)
+        field.prepare(self, polls)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual([field(self, poll) for poll in polls], [0, 0])
+
+    def test_lock(self):
+        @easy.cache(10, lock=True)
+        def field(admin, obj):
+            return uuid.uuid1()
+
+        version = decorators.get_cache_versions([self.pool])[self.pool.pk]
+        key = helper.cache_method_key(self.pool, field.__qualname__, version)
+        decorators.django_cache.set(key, ('stale', time.time() - 1, 0.1))
+
+        # another worker is recomputing
+        decorators.django_cache.add(key + '.lock', True)
+        self.assertEqual(field(self, self.pool), 'stale')
+        field.prepare(self, [self.pool])
+        self.assertEqual(field(self, self.pool), 'stale')
+
+        decorators.django_cache.delete(key + '.lock')
+        # a new instance, the page memo holds the value prepared for the old one
+        pool = Poll.objects.get(pk=self.pool.pk)
+        value = field(self, pool)
+        self.assertNotEqual(value, 'stale')
+        self.assertEqual(field(self, pool), value)
+        self.assertIsNone(decorators.django_cache.get(key + '.lock'))
+
+    def test_early_recompute(self):
+        self.assertFalse(decorators.should_recompute(time.time() + 10, 0.1))
+        self.assertTrue(decorators.should_recompute(time.time() - 1, 0.1))
+        with mock.patch.object(decorators.random, 'random', return_value=0.99):
+            # -log(0.01) * 1s * 1 > 4s
+            self.assertTrue(decorators.should_recompute(time.time() + 4, 1, beta=1))
+            self.assertFalse(decorators.should_recompute(time.time() + 5, 1, beta=1))
+
+    def test_request_cache(self):
+        pool = Poll.objects.get(pk=self.pool.pk)
+        with helper.request_cache(), \
+                mock.patch.object(decorators, 'django_cache', wraps=decorators.django_cache) as cache:
+            self.assertEqual(self.field(pool), self.value)
+            self.assertEqual(cache.get_many.call_count, 2)
+
+            # another instance, not memoized, read from the request-local cache
+            self.assertEqual(self.field(Poll.objects.get(pk=self.pool.pk)), self.value)
+            self.assertEqual(cache.get_many.call_count, 2)
+
+            easy.clear_cache(self.pool)
+            self.assertNotEqual(self.field(Poll.objects.get(pk=self.pool.pk)), self.value)
+
+        self.assertIsNone(helper._local_cache.get())
+
+    def test_another_object(self):
+        pool2 = baker.make(Poll)
+
+        self.assertNotEqual(self.field(self.pool), self.field(pool2))
+
+    def test_cache_key(self):
+        self.assertEqual(
+            helper.cache_method_key(self.pool, 'method', '1.2'), 'easy.test_app.poll.method.%s.1.2' % self.pool.pk
+        )
+        self.assertEqual(helper.cache_object_key(self.pool), 'easy.test_app.poll.%s' % self.pool.pk)
+        self.assertEqual(helper.cache_model_key(Poll), 'easy.test_app.poll')
+
+    def test_prepare(self):
+        polls = [self.pool] + baker.make(Poll, _quantity=3)
+
+        with mock.patch.object(decorators, 'django_cache', wraps=decorators.django_cache) as cache:
+            self.field.prepare(self, polls)
+            values = [self.field(poll) for poll in polls]
+            # generations and values
+            self.assertEqual((cache.get_many.call_count, cache.set_many.call_count, cache.get.call_count), (2, 1, 0))
+
+            self.field.prepare(self, polls)
+            self.assertEqual([self.field(poll) for poll in polls], values)
+            self.assertEqual((cache.get_many.call_count, cache.set_many.call_count), (4, 1))
+
+        self.assertEqual(values[0], self.value)
+        self.assertEqual(len(set(values)), 4)
+
+    def test_delete_cache_other_object(self):
+        pool2 = baker.make(Poll)
+        value2 = self.field(pool2)
+
+        easy.clear_cache(self.pool)
+
+        self.assertNotEqual(self.field(self.pool), self.value)
+        self.assertEqual(self.field(pool2), value2)
+
+    def test_delete_cache_model(self):
+        pool2 = baker.make(Poll)
+        value2 = self.field(pool2)
+
+        easy.clear_cache(Poll)
+
+        self.assertNotEqual(self.field(self.pool), self.value)
+        self.assertNotEqual(self.field(pool2), value2)
+
+    def test_delete_cache_generation(self):
+        easy.clear_cache(self.pool)
+        generation = decorators.django_cache.get(helper.cache_object_key(self.pool))
+        easy.clear_cache(self.pool)
+
+        self.assertEqual(decorators.django_cache.get(helper.cache_object_key(self.pool)), generation + 1)
+
+
+class TestCacheDepends(OnCommitTestCase):
+
+    @easy.cache(10, depends=('question_set',))
+    def questions(self, obj):
+        return uuid.uuid1()
+
+    @easy.cache(10, depends=('poll',))
+    def poll(self, obj):
+        return uuid.uuid1()
+
+    @easy.cache(10, depends=('groups',))
+    def groups(self, obj):
+        return uuid.uuid1()
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.poll1, self.poll2 = baker.make(Poll, _quantity=2)
+            self.question = baker.make(Question, poll=self.poll1)
+
+    def test_save_object(self):
+        value = self.questions(self.poll1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.poll1.save()
+
+        self.assertNotEqual(self.questions(self.poll1), value)
+
+    def test_save_related(self):
+        values = self.questions(self.poll1), self.questions(self.poll2)
+        with self.captureOnCommitCallbacks(execute=True):
+            baker.make(Question, poll=self.poll1)
+
+        self.assertNotEqual(self.questions(self.poll1), values[0])
+        self.assertEqual(self.questions(self.poll2), values[1])
+
+    def test_move_related(self):
+        values = self.questions(self.poll1), self.questions(self.poll2)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.poll = self.poll2
+            self.question.save()
+
+        self.assertNotEqual(self.questions(self.poll1), values[0])
+        self.assertNotEqual(self.questions(self.poll2), values[1])
+
+    def test_delete_related(self):
+        value = self.questions(self.poll1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.question.delete()
+
+        self.assertNotEqual(self.questions(self.poll1), value)
+
+    def test_forward_related(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            other = baker.make(Question, poll=self.poll2)
+        values = self.poll(self.question), self.poll(other)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.poll1.name = 'changed'
+            self.poll1.save()
+
+        self.assertNotEqual(self.poll(self.question), values[0])
+        self.assertEqual(self.poll(other), values[1])
+
+    def test_many_to_many(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            user = baker.make(User)
+            group = baker.make(Group)
+        value = self.groups(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            group.user_set.add(user)
+        self.assertNotEqual(self.groups(user), value)
+
+        value = self.groups(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            group.user_set.clear()
+        self.assertNotEqual(self.groups(user), value)
+
+    def test_invalidate_on_commit(self):
+        value = self.questions(self.poll1)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.poll1.save()
+            baker.make(Question, poll=self.poll1)
+
+        self.assertEqual(self.questions(self.poll1), value)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(self.questions(self.poll1), value)
+
+    def test_invalid_path(self):
+        with self.assertRaises(ValueError):
+            easy.cache(10, depends=('name',))(lambda admin, obj: None)(self, self.poll1)
+
 
 class TestMultiDecorator(test.TestCase):
 
@@ -464,6 +1126,60 @@ class TestActionDecorator(test.TestCase):
         self.assertEqual(field.allowed_permissions, ['change',])
 
 
+@test.override_settings(EASY_ACTION_EXECUTOR='easy.jobs.ImmediateExecutor')
+class TestBackgroundAction(OnCommitTestCase):
+
+    def setUp(self):
+        self.user = baker.make(User, is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        self.polls = baker.make(Poll, _quantity=3, name='eba')
+
+    def start(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/admin/test_app/poll/', {
+                'action': 'upper_name', '_selected_action': [poll.pk for poll in self.polls]
+            })
+        self.assertEqual(response.status_code, 302)
+
+        message = str(list(get_messages(response.wsgi_request))[0])
+        self.assertIn('/easy/job/', message)
+        return message.split('Job ')[-1].split('<')[0]
+
+    def test_background_action(self):
+        job_id = self.start()
+
+        self.assertEqual(set(Poll.objects.values_list('name', flat=True)), {'EBA'})
+        response = self.client.get('/admin/test_app/poll/%s/easy/job/' % job_id)
+        self.assertEqual(response.json(), {
+            'id': job_id, 'status': 'done', 'action': 'upper_name', 'user': self.user.pk,
+            'done': 3, 'total': 3, 'result': 3, 'error': None,
+        })
+
+    def test_objects_by_chunk(self):
+        pks = [poll.pk for poll in reversed(self.polls)]
+        self.polls[1].delete()
+
+        with self.assertNumQueries(2):
+            objects = list(jobs.iter_objects(Poll, pks + [0], 2))
+        self.assertEqual(objects, [self.polls[2], self.polls[0]])
+
+    def test_job_of_another_user(self):
+        job_id = self.start()
+
+        self.client.force_login(baker.make(User, is_staff=True, is_superuser=False))
+        self.assertEqual(self.client.get('/admin/test_app/poll/%s/easy/job/' % job_id).status_code, 404)
+
+    def test_picklable_job(self):
+        with mock.patch.object(jobs.get_executor(), 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                job = jobs.start_job(PollAdmin(Poll, admin_site), 'upper_name', 1, [1, 2])
+
+        fn, *args = submit.call_args[0]
+        self.assertIs(pickle.loads(pickle.dumps(fn)), jobs.run_job)
+        self.assertEqual(pickle.loads(pickle.dumps(args)), [job.id, 'admin', 'test_app', 'poll', 'upper_name', [1, 2]])
+        self.assertEqual(job.get_state()['status'], 'pending')
+
+
 class TestEasyView(test.TestCase):
 
     @classmethod
@@ -474,10 +1190,41 @@ class TestEasyView(test.TestCase):
     def test_register_view(self):
         views = self.admin.get_urls()
 
+        # an object and a list view by action (test, ping, job and lazy) but the list one of job
+        # and the object one of lazy, the bulk view, plus the legacy ones
         if django.VERSION < (2, 0) or django.VERSION > (3, 2):
-            self.assertEqual(len(views), 8)
+            self.assertEqual(len(views), 8 + 7)
         else:
-            self.assertEqual(len(views), 9)
+            self.assertEqual(len(views), 9 + 7)
+        # only the redirect of the admin comes after them
+        self.assertEqual(views[-3].name, 'test_app_poll_easy')
+        self.assertEqual(views[0].name, 'test_app_poll_changelist')
+
+    def test_view_urls(self):
+        self.assertEqual(self.admin.get_easy_pk_converter(), 'int')
+        self.assertEqual(reverse('admin:test_app_poll_easy_test', args=(1,)), '/admin/test_app/poll/1/easy/test/')
+        self.assertEqual(reverse('admin:test_app_poll_easy_test'), '/admin/test_app/poll/easy/test/')
+        self.assertEqual(reverse('admin:test_app_poll_easy', args=(1, 'test')), '/admin/test_app/poll/1/easy/test/')
+        self.assertEqual(reverse('admin:test_app_poll_easy', args=('test',)), '/admin/test_app/poll/easy/test/')
+
+        match = resolve('/admin/test_app/poll/1/easy/test/')
+        self.assertEqual((match.url_name, match.kwargs), ('test_app_poll_easy_test', {'pk': 1, 'action': 'test'}))
+        self.assertEqual(resolve('/admin/test_app/poll/abc/easy/test/').url_name, 'test_app_poll_easy')
+        self.assertEqual(resolve('/admin/test_app/poll/0a1b/easy/job/').url_name, 'test_app_poll_easy_job')
+        self.assertEqual(resolve('/admin/test_app/poll/easy/job/').url_name, 'test_app_poll_easy')
+
+    def test_fallback_view(self):
+        self.client.force_login(baker.make(User, is_staff=True, is_superuser=True))
+
+        response = self.client.get('/admin/test_app/poll/1/easy/nope/', follow=True)
+        self.assertEqual(response.redirect_chain[0], ('/admin/test_app/poll/1/change/', 302))
+        self.assertIn('Easy view easy_view_nope not found', [str(m) for m in response.context['messages']])
+        response = self.client.get('/admin/test_app/poll/easy/nope/')
+        self.assertRedirects(response, '/admin/test_app/poll/', fetch_redirect_response=False)
+
+        # known actions, without the pk they take
+        self.assertEqual(self.client.get('/admin/test_app/poll/easy/job/').status_code, 404)
+        self.assertEqual(self.client.get('/admin/test_app/poll/abc/easy/test/').status_code, 404)
 
     def test_exist_view(self):
         request = HttpRequest()
@@ -487,6 +1234,55 @@ class TestEasyView(test.TestCase):
         self.assertEqual(response1.status_code, 200)
         self.assertEqual(response2.status_code, 200)
 
+    @unittest.skipIf(django.VERSION < (3, 1), 'async views need Django 3.1')
+    def test_async_view(self):
+        self.assertEqual(self.admin.get_easy_async_actions(), ['ping'])
+
+        self.client.force_login(baker.make(User, is_staff=True, is_superuser=True))
+        self.async_client.force_login(baker.make(User, is_staff=True, is_superuser=True))
+        for client in (self.client, self.async_client):
+            get = async_to_sync(client.get) if client is self.async_client else client.get
+            self.assertEqual(get('/admin/test_app/poll/easy/ping/').content, b'pong with list')
+            self.assertEqual(get('/admin/test_app/poll/1/easy/ping/').content, b'pong with 1')
+
+    @unittest.skipIf(django.VERSION < (3, 1), 'async views need Django 3.1')
+    def test_async_view_permission(self):
+        self.async_client.force_login(baker.make(User, is_staff=False))
+        response = async_to_sync(self.async_client.get)('/admin/test_app/poll/easy/ping/')
+
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(response.url.startswith('/admin/login/'))
+
+    def test_bulk_view(self):
+        polls = baker.make(Poll, _quantity=3, name='Eba')
+        pks = [poll.pk for poll in polls]
+        request = test.RequestFactory().post('/', pks + [0], content_type='application/json')
+
+        with self.assertNumQueries(1):
+            response = self.admin.easy_bulk_view(request, 'names')
+
+        self.assertEqual(json.loads(response.content), {
+            'results': {str(pk): 'Eba' for pk in pks}, 'missing': ['0'],
+        })
+
+    def test_bulk_view_fallback(self):
+        polls = baker.make(Poll, _quantity=2)
+        self.client.force_login(baker.make(User, is_staff=True, is_superuser=True))
+
+        response = self.client.post('/admin/test_app/poll/easy/test/bulk/', {'pk': [polls[0].pk, polls[1].pk, 'x']})
+
+        self.assertEqual(response.json(), {
+            'results': {str(poll.pk): {'status': 200, 'content': 'test is ok with %s' % poll.pk} for poll in polls},
+            'missing': ['x'],
+        })
+        self.assertEqual(self.client.get('/admin/test_app/poll/easy/test/bulk/').status_code, 405)
+        # no bulk view of views without pk, or with their own
+        self.assertEqual(self.client.post('/admin/test_app/poll/easy/lazy/bulk/', {'pk': 1}).status_code, 404)
+        self.assertEqual(self.client.post('/admin/test_app/poll/easy/job/bulk/', {'pk': 1}).status_code, 404)
+        self.assertEqual(self.client.get('/admin/test_app/poll/1/easy/lazy/').status_code, 404)
+        self.assertEqual(self.client.post('/admin/test_app/poll/easy/test/bulk/', '{"pks": 1}',
+                                          content_type='application/json').status_code, 400)
+
     def test_not_exist_view(self):
         from django.contrib.messages.storage import default_storage
 
@@ -502,6 +1298,349 @@ class TestEasyView(test.TestCase):
         self.assertEqual(len(request._messages._queued_messages), 2)
 
 
+class TestMixinEasyFields(test.TestCase):
+
+    def test_query_plan(self):
+        admin = QuestionAdmin(Question, AdminSite())
+
+        plan = admin.get_easy_query_plan(HttpRequest())
+
+        self.assertEqual(plan, {'select_related': ('poll',), 'prefetch_related': (), 'annotate': {}})
+
+    def test_query_plan_paths(self):
+        plan = helper.plan_related(Question, [
+            'poll.name', 'poll_id', 'poll.question_set.count', 'choice_set.all', 'question_text'
+        ])
+
+        self.assertEqual(plan['select_related'], ('poll',))
+        self.assertEqual(plan['prefetch_related'], ('choice_set',))
+
+    def test_query_plan_counts(self):
+        # one COUNT by object, not every related row
+        plan = helper.plan_related(Question, ['choice_set.count', 'poll.question_set.exists'])
+
+        self.assertEqual(plan, {'select_related': ('poll',), 'prefetch_related': ()})
+
+    def test_query_plan_generic(self):
+        plan = helper.plan_related(Tag, ['generic', 'generic.username'])
+
+        self.assertEqual(plan['select_related'], ('content_type',))
+        self.assertEqual(plan['prefetch_related'], ('generic',))
+
+    def test_queryset(self):
+        admin = QuestionAdmin(Question, AdminSite())
+        baker.make(Question, _quantity=5, poll=baker.make(Poll))
+        baker.make(Question, _quantity=5, poll=baker.make(Poll))
+
+        request = HttpRequest()
+        request.user = baker.make(User, is_staff=True, is_superuser=True)
+        changelist = admin.get_changelist_instance(request)
+
+        with self.assertNumQueries(1):
+            for question in changelist.queryset:
+                admin.poll_link(question)
+
+        # only the changelist is planned
+        self.assertFalse(admin.get_queryset(request).query.select_related)
+
+    def test_changelist_of_mixin(self):
+        class CustomChangeList(ChangeList):
+            pass
+
+        class ChangeListMixin(object):
+            def get_changelist(self, request, **kwargs):
+                return CustomChangeList
+
+        class CustomAdmin(easy.MixinEasyFields, ChangeListMixin, ModelAdmin):
+            list_display = ('question_text', 'poll_link')
+            poll_link = QuestionAdmin.poll_link
+
+        admin = CustomAdmin(Question, AdminSite())
+        changelist = admin.get_changelist(HttpRequest())
+
+        self.assertTrue(issubclass(changelist, CustomChangeList))
+        self.assertTrue(issubclass(changelist, MixinEasyChangeList))
+        self.assertIs(admin.get_changelist(HttpRequest()), changelist)
+        self.assertIs(QuestionAdmin(Question, AdminSite()).get_changelist(HttpRequest()), EasyChangeList)
+
+        baker.make(Question, _quantity=5, poll=baker.make(Poll))
+        request = HttpRequest()
+        request.user = baker.make(User, is_staff=True, is_superuser=True)
+        changelist = admin.get_changelist_instance(request)
+
+        with self.assertNumQueries(1):
+            for question in changelist.queryset:
+                admin.poll_link(question)
+
+
+class TestExport(test.TestCase):
+
+    def setUp(self):
+        self.admin = QuestionAdmin(Question, AdminSite())
+        self.poll = baker.make(Poll)
+        baker.make(Question, _quantity=5, poll=self.poll, question_text='Eba!')
+
+    def test_csv(self):
+        queryset = self.admin.get_queryset(HttpRequest())
+        response = self.admin.export_csv(HttpRequest(), queryset)
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="question.csv"')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'ID,Poll,First,Question text,Date published')
+        self.assertEqual(len(lines), 6)
+        values = lines[1].split(',')
+        self.assertEqual((values[1], values[3]), ('Poll object (%s)' % self.poll.pk, 'Eba!'))
+        self.assertIn(values[2], ('True', 'False'))
+
+    def test_ndjson(self):
+        queryset = self.admin.get_queryset(HttpRequest())
+        response = self.admin.export_ndjson(HttpRequest(), queryset)
+
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['Poll'], 'Poll object (%s)' % self.poll.pk)
+        self.assertEqual(rows[0]['Question text'], 'Eba!')
+
+    def test_queries_by_chunk(self):
+        self.admin.easy_export_chunk_size = 2
+        queryset = self.admin.get_queryset(HttpRequest())
+
+        # one query read by chunks of the cursor, poll is selected with the questions
+        with self.assertNumQueries(1):
+            rows = list(self.admin.iter_export_rows(HttpRequest(), queryset, 2))
+        self.assertEqual(len(rows), 6)
+
+    def test_raw_text(self):
+        question = baker.make(Question, poll=self.poll, question_text='x<y>z & <b>')
+
+        self.assertEqual(self.admin.get_export_value(question, 'question_text'), 'x<y>z & <b>')
+        self.assertEqual(self.admin.get_export_value(question, 'poll_link'), 'Poll object (%s)' % self.poll.pk)
+
+    def test_lazy(self):
+        admin = PollAdmin(Poll, AdminSite())
+        poll = baker.make(Poll, name='hello')
+
+        rows = list(admin.iter_export_rows(HttpRequest(), Poll.objects.filter(pk=poll.pk)))
+        self.assertEqual(rows[1], ['hello', '0', 'hello'])
+
+
+class TestRenderMany(test.TestCase):
+
+    def test_foreignkey(self):
+        baker.make(Question, _quantity=5, poll=baker.make(Poll))
+        baker.make(Question, _quantity=5, poll=baker.make(Poll))
+        questions = list(Question.objects.all())
+        custom_field = easy.ForeignKeyAdminField('poll', 'poll.name')
+
+        with self.assertNumQueries(1):
+            custom_field.prepare(questions)
+        with self.assertNumQueries(0):
+            for question in questions:
+                self.assertEqual(custom_field(question), easy.ForeignKeyAdminField('poll', 'poll.name')(question))
+
+    def test_raw_id(self):
+        questions = baker.make(Question, _quantity=3)
+        custom_field = easy.RawIdAdminField('poll')
+        custom_field.prepare(questions)
+
+        for question in questions:
+            self.assertEqual(custom_field(question), easy.RawIdAdminField('poll')(question))
+
+    def test_generic_foreignkey(self):
+        for _ in range(5):
+            baker.make(Tag, generic=baker.make(User))
+            baker.make(Tag, generic=baker.make(Poll))
+        custom_field = easy.GenericForeignKeyAdminField('generic', related_attr='pk')
+        expected = [custom_field.render(tag) for tag in Tag.objects.all()]
+        tags = list(Tag.objects.all())
+        ContentType.objects.clear_cache()
+
+        # one content type and one in_bulk for each model
+        with self.assertNumQueries(4):
+            custom_field.prepare(tags)
+        with self.assertNumQueries(0):
+            self.assertEqual([custom_field(tag) for tag in tags], expected)
+
+    def test_generic_foreignkey_content_type_cached(self):
+        tags = [baker.make(Tag, generic=baker.make(User)) for _ in range(3)]
+        custom_field = easy.GenericForeignKeyAdminField('generic')
+        ContentType.objects.get_for_model(User)
+
+        with self.assertNumQueries(0):
+            custom_field.prepare(tags)
+
+    def test_link_changelist(self):
+        for poll in baker.make(Poll, _quantity=3):
+            baker.make(Question, _quantity=2, poll=poll)
+        polls = list(Poll.objects.all())
+        custom_field = easy.LinkChangeListAdminField('test_app', 'question', 'question_set.all', {'poll': 'id'})
+
+        with self.assertNumQueries(1):
+            custom_field.prepare(polls)
+        with self.assertNumQueries(0):
+            for poll in polls:
+                self.assertIn('Question object', custom_field(poll))
+
+    def test_memo_same_instance_only(self):
+        question = baker.make(Question)
+        custom_field = easy.ForeignKeyAdminField('poll')
+        custom_field.prepare([Question.objects.get(pk=question.pk)])
+        question = Question.objects.get(pk=question.pk)
+
+        with self.assertNumQueries(1):
+            custom_field(question)
+
+    def test_memo_cleared_after_request(self):
+        question = Question.objects.select_related('poll').get(pk=baker.make(Question).pk)
+        custom_field = easy.ForeignKeyAdminField('poll')
+        custom_field.prepare([question])
+        self.assertIsNot(helper.get_memoized(custom_field, question), helper.NOTHING)
+
+        request_finished.send(sender=self.__class__)
+        self.assertIs(helper.get_memoized(custom_field, question), helper.NOTHING)
+
+    def test_changelist_queries(self):
+        self.client.force_login(baker.make(User, is_staff=True, is_superuser=True))
+
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get('/admin/test_app/poll/')
+            self.assertEqual(response.status_code, 200)
+            return len(context.captured_queries)
+
+        baker.make(Question, _quantity=2, poll=baker.make(Poll))
+        few = count_queries()
+        for poll in baker.make(Poll, _quantity=10):
+            baker.make(Question, _quantity=2, poll=poll)
+
+        self.assertEqual(few, count_queries())
+
+
+class TestLazyField(test.TestCase):
+
+    def setUp(self):
+        self.admin = PollAdmin(Poll, AdminSite())
+        self.user = baker.make(User, is_staff=True, is_superuser=True)
+
+    def test_placeholder(self):
+        poll = baker.make(Poll, name='Eba')
+        self.client.force_login(self.user)
+
+        response = self.client.get('/admin/test_app/poll/')
+
+        self.assertContains(response, (
+            '<span class="easy-lazy" data-easy-url="/admin/test_app/poll/easy/lazy/" data-easy-field="slow_name" '
+            'data-easy-pk="%s">&hellip;</span>' % poll.pk
+        ))
+        self.assertContains(response, 'easy/js/lazy.js')
+        self.assertEqual(easy.SimpleAdminField('name', lazy=True)(poll), 'Eba')
+
+    def test_lazy_view(self):
+        polls = [baker.make(Poll, name='<b>Eba</b>'), baker.make(Poll, name='')]
+        request = test.RequestFactory().get('/', {
+            'field': ['slow_name', 'name', 'count_question'], 'pk': [polls[0].pk, polls[1].pk, 'x'],
+        })
+        request.user = self.user
+
+        with self.assertNumQueries(1):
+            response = self.admin.easy_view_lazy(request)
+
+        # only the lazy fields, escaped like the other cells, '' is the empty value display or a blank cell
+        # depending on the Django version
+        empty = str(display_for_value('', self.admin.get_empty_value_display())) or '&nbsp;'
+        self.assertEqual(json.loads(response.content), {
+            'slow_name': {str(polls[0].pk): '&lt;b&gt;Eba&lt;/b&gt;', str(polls[1].pk): empty},
+        })
+
+    def test_check(self):
+        class FieldsAdmin(easy.MixinEasyFields, ModelAdmin):
+            list_display = ('name', 'slow_name')
+            slow_name = easy.SimpleAdminField('name', lazy=True)
+
+        site = AdminSite(name='lazy_check')
+        site.register(Poll, FieldsAdmin)
+        site.register(Question, PollAdmin)
+
+        errors = [error for error in check_lazy_fields() if error.obj in (FieldsAdmin, PollAdmin)]
+        self.assertEqual([(error.id, error.obj) for error in errors], [('easy.E001', FieldsAdmin)])
+        self.assertIn("'slow_name'", errors[0].msg)
+
+    def test_not_lazy_boolean(self):
+        class IconField(easy.SimpleAdminField):
+            boolean = True
+
+        with self.assertRaises(ValueError):
+            IconField('name', lazy=True)
+        with self.assertRaises(TypeError):
+            easy.BooleanAdminField('name', lazy=True)
+
+    def test_lazy_view_permission(self):
+        request = test.RequestFactory().get('/', {'field': 'slow_name', 'pk': 1})
+        request.user = baker.make(User, is_staff=True)
+
+        with self.assertRaises(PermissionDenied):
+            self.admin.easy_view_lazy(request)
+
+
+class TestInstrumentation(test.TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_collect(self):
+        baker.make(Question, _quantity=2, poll=baker.make(Poll))
+        field = easy.SimpleAdminField('poll.name')
+
+        class Admin(object):
+            @easy.short(desc='Text')
+            def text(self, obj):
+                return obj.question_text
+
+            @easy.cache(10)
+            def cached(self, obj):
+                return obj.question_text
+
+        admin = Admin()
+        self.assertFalse(instrumentation.is_active())
+        with instrumentation.collect() as stats:
+            self.assertTrue(instrumentation.is_active())
+            for question in Question.objects.all():
+                field(question)
+                admin.text(question)
+                admin.cached(question)
+                admin.cached(question)
+
+        self.assertFalse(instrumentation.is_active())
+        self.assertEqual(stats[field.get_cache_name()]['queries'], 2)
+        self.assertEqual(stats[field.get_cache_name()]['calls'], 2)
+        self.assertEqual(stats[Admin.text.__qualname__]['queries'], 0)
+        self.assertEqual(
+            {key: stats[Admin.cached.__qualname__][key] for key in ('calls', 'hits', 'misses')},
+            {'calls': 4, 'hits': 2, 'misses': 2},
+        )
+
+    def test_middleware(self):
+        baker.make(Poll, _quantity=2)
+        user = baker.make(User, is_staff=True, is_superuser=True)
+        self.client.force_login(user)
+
+        self.assertFalse(self.client.get('/admin/test_app/poll/').has_header('Server-Timing'))
+
+        # the middleware is loaded by the first request of a client
+        client = test.Client()
+        client.force_login(user)
+        with test.override_settings(
+            EASY_INSTRUMENTATION=True,
+            EASY_INSTRUMENTATION_SINKS=['easy.instrumentation.header_sink'],
+            MIDDLEWARE=list(settings.MIDDLEWARE) + ['easy.middleware.EasyInstrumentationMiddleware'],
+        ):
+            response = client.get('/admin/test_app/poll/')
+
+        # prepared with the page, then rendered by row
+        self.assertIn('PollAdmin.count_question: 3 calls, 0 queries', response['Server-Timing'])
+
+
 class TestUtilActionRedirect(test.TestCase):
 
     def test_response_normal(self):
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import posixpath
+from io import BytesIO
+from typing import Any, Optional, Tuple
+
+from django.core.files.base import ContentFile
+
+# url, width and height of a thumbnail, easy.thumbnail.<hash of the image name and stamp>.<width>x<height>
+EASY_CACHE_TEMPLATE_THUMBNAIL = 'easy.thumbnail.{}.{}x{}'
+
+
+def thumbnail_stamp(file: Any) -> str:
+    """
+    Stamp of an image on its storage, its modification time or, on storages without it, its size,
+    so an image replaced under the same name gets new thumbnails.
+
+    Args:
+        file (FieldFile): The image.
+
+    Returns:
+        str: The stamp, in hexadecimal, or an empty string if the image can not be found.
+    """
+    try:
+        try:
+            return '%x' % int(file.storage.get_modified_time(file.name).timestamp())
+        except NotImplementedError:
+            return '%x' % file.size
+    except (OSError, ValueError, NotImplementedError):
+        return ''
+
+
+def thumbnail_name(name: str, width: int, height: int, stamp: str = '') -> str:
+    """
+    Name of a thumbnail on the storage, on a `thumbnails` directory next to the image,
+    like `photos/thumbnails/cat.100x100.65f1a2b3.jpg` for `photos/cat.jpg`.
+
+    Args:
+        name (str): The name of the image on the storage.
+        width (int): The maximum width of the thumbnail.
+        height (int): The maximum height of the thumbnail.
+        stamp (str): The stamp of the image, see thumbnail_stamp. Defaults to ''.
+
+    Returns:
+        str: The name of the thumbnail.
+    """
+    directory, filename = posixpath.split(name)
+    stem, ext = posixpath.splitext(filename)
+    size = '{}x{}.{}'.format(width, height, stamp) if stamp else '{}x{}'.format(width, height)
+    return posixpath.join(directory, 'thumbnails', '{}.{}{}'.format(stem, size, ext))
+
+
+def get_thumbnail(file: Any, width: int, height: int, stamp: str = '') -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Gets a thumbnail of an image, fitting in `width` x `height` and keeping its aspect ratio, from its storage,
+    or makes it and saves it there. Images smaller than the box are not enlarged.
+
+    Args:
+        file (FieldFile): The image.
+        width (int): The maximum width of the thumbnail.
+        height (int): The maximum height of the thumbnail.
+        stamp (str): The stamp of the image, see thumbnail_stamp. Defaults to ''.
+
+    Returns:
+        Tuple[str, Optional[int], Optional[int]]: The url, width and height of the thumbnail,
+        or the url of the image and no size if it can not be read, or the thumbnail not saved.
+    """
+    # Pillow is only needed by the fields with thumbnails
+    from PIL import Image, ImageOps
+
+    storage = file.storage
+    name = thumbnail_name(file.name, width, height, stamp)
+    try:
+        if storage.exists(name):
+            with storage.open(name) as thumbnail_file, Image.open(thumbnail_file) as thumbnail:
+                return storage.url(name), thumbnail.width, thumbnail.height
+
+        with storage.open(file.name) as image_file, Image.open(image_file) as image:
+            image_format = image.format or 'PNG'
+            thumbnail = ImageOps.exif_transpose(image)
+            thumbnail.thumbnail((width, height))
+            if image_format == 'JPEG' and thumbnail.mode not in ('RGB', 'L'):
+                thumbnail = thumbnail.convert('RGB')
+            content = BytesIO()
+            thumbnail.save(content, format=image_format)
+
+        name = storage.save(name, ContentFile(content.getvalue()))
+    except (OSError, ValueError):
+        # missing or not an image, or a storage that can not be written
+        return file.url, None, None
+
+    return storage.url(name), thumbnail.width, thumbnail.height
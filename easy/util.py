@@ -5,6 +5,7 @@ from typing import Optional
 import django.http
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.utils.html import format_html
 
 HttpRequest: django.http.HttpRequest
 HttpResponseRedirect: django.http.HttpResponseRedirect
@@ -14,6 +15,7 @@ def action_response(
     message: Optional[str] = None,
     level: int = messages.INFO,
     keep_querystring: bool = True,
+    job: Optional[str] = None,
 ) -> HttpResponseRedirect:
     """
     Redirects the user to the current page with an optional message.
@@ -23,6 +25,7 @@ def action_response(
         message: The message to display to the user.
         level: The level of the message.
         keep_querystring: Whether to keep the query string in the redirect URL.
+        job: The id of a background action, linked on the message.
 
     Returns:
         An HttpResponseRedirect object.
@@ -30,6 +33,10 @@ def action_response(
     redirect_url = "."
     if keep_querystring and request.GET:
         redirect_url = "./?" + request.GET.urlencode()
+    if job:
+        message = format_html(
+            '{} <a href="{}">Job {}</a>', message or '', './%s/easy/job/' % job, job
+        )
     if message:
         messages.add_message(request, level, message, fail_silently=True)
     return redirect(redirect_url)
@@ -1,4 +1,6 @@
 # coding: utf-8
+import asyncio
+
 from django.contrib import admin
 from django.http.response import HttpResponse
 import easy
@@ -10,8 +12,9 @@ class ChoiceInline(admin.StackedInline):
     extra = 3
 
 
-class QuestionAdmin(admin.ModelAdmin):
+class QuestionAdmin(easy.MixinEasyFields, admin.ModelAdmin):
     list_display = ('id', 'poll_link', 'bool_sample', 'question_text', 'pub_date',)
+    actions = ('export_csv', 'export_ndjson')
     list_filter = ('pub_date',)
     search_fields = ('question_text',)
     fieldsets = (
@@ -30,16 +33,35 @@ class QuestionAdmin(admin.ModelAdmin):
     bool_sample = easy.BooleanAdminField(lambda x: x.id == 1, 'First')
 
 
-class PollAdmin(easy.MixinEasyViews, admin.ModelAdmin):
-    list_display = ('name', 'count_question')
+class PollAdmin(easy.MixinEasyFields, easy.MixinEasyViews, admin.ModelAdmin):
+    list_display = ('name', 'count_question', 'slow_name')
+    actions = ('upper_name',)
 
-    count_question = easy.LinkChangeListAdminField('test_app', 'question', 'question_set.count', {'poll': 'id'}, 'Count')
+    count_question = easy.LinkChangeListAdminField('test_app', 'question', 'question_set.count', {'poll': 'id'},
+                                                    short_description='Count', count='question')
+    slow_name = easy.SimpleAdminField('name', 'Slow name', lazy=True)
 
     def easy_view_test(self, request, *args):
 
         return HttpResponse('test is ok with %s' % (args or 'list'))
 
-class TagAdmin(admin.ModelAdmin):
+    async def easy_view_ping(self, request, *args):
+        await asyncio.sleep(0)
+        return HttpResponse('pong with %s' % (args or 'list'))
+
+    def easy_bulk_view_names(self, request, objects):
+        return {pk: poll.name for pk, poll in objects.items()}
+
+    @easy.action('Upper names in background', background=True)
+    def upper_name(self, job, objects):
+        done = 0
+        for done, poll in enumerate(objects, 1):
+            poll.name = poll.name.upper()
+            poll.save()
+            job.progress(done)
+        return done
+
+class TagAdmin(easy.MixinEasyFields, admin.ModelAdmin):
     list_display = ('name', 'generic_link')
 
     generic_link = easy.GenericForeignKeyAdminField('generic', cache_content_type=True)
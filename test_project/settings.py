@@ -50,6 +50,7 @@ MIDDLEWARE = (
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'easy.middleware.EasyCacheMiddleware',
 
     # 'debug_toolbar.middleware.DebugToolbarMiddleware',
 )